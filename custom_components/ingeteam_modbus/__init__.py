@@ -2,6 +2,7 @@
 import asyncio
 import logging
 import threading
+import time
 from datetime import timedelta
 from typing import Optional
 
@@ -17,7 +18,8 @@ from homeassistant.const import (
     CONF_PORT,
     CONF_SCAN_INTERVAL,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_track_time_interval
 
 from .const import (
@@ -28,15 +30,36 @@ from .const import (
     CONF_MODBUS_ADDRESS,
     CONF_READ_METER,
     CONF_READ_BATTERY,
+    CONF_WATCH_INTERVAL,
+    CONF_EXPOSE_METRICS,
     DEFAULT_READ_METER,
     DEFAULT_READ_BATTERY,
-    BOOLEAN_STATUS,
-    INVERTER_STATUS,
-    BATTERY_STATUS,
-    BATTERY_BMS_ALARMS,
-    BATTERY_LIMITATION_REASONS,
-    AP_REDUCTION_REASONS,
+    DEFAULT_WATCH_INTERVAL,
+    DEFAULT_EXPOSE_METRICS,
+    DATA_METRICS_VIEW,
+    CONF_CAPABILITIES,
+    CONF_TIMEOUT,
+    CAPABILITY_BATTERY,
+    CAPABILITY_METER,
+    DEFAULT_TIMEOUT,
+    CONF_PROFILE,
+    PROFILE_AUTO,
+    SERVICE_WRITE_REGISTERS,
+    ATTR_HUB,
+    ATTR_ADDRESS,
+    ATTR_VALUES,
+    EVENT_STATUS_CHANGED,
+    SANITY_LIMITS,
 )
+from .decoding import BitfieldDecoder
+from .validation import SampleValidator
+from .coordinator import async_get_poll_coordinator
+from .snapshot import IngeteamSnapshot
+from .polling import PollTracker, SlotLease
+from .writes import WriteCoalescer
+from .metrics import IngeteamMetricsView
+from .probe import ProbeError, probe_device
+from .profiles import DEFAULT_PROFILE, get_profile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,17 +72,55 @@ INGETEAM_MODBUS_SCHEMA = vol.Schema(
         vol.Optional(CONF_READ_METER, default=DEFAULT_READ_METER): cv.boolean,
         vol.Optional(CONF_READ_BATTERY, default=DEFAULT_READ_BATTERY): cv.boolean,
         vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): cv.positive_int,
+        vol.Optional(CONF_WATCH_INTERVAL, default=DEFAULT_WATCH_INTERVAL): cv.positive_int,
+        vol.Optional(CONF_EXPOSE_METRICS, default=DEFAULT_EXPOSE_METRICS): cv.boolean,
+        vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): cv.positive_float,
     }
 )
 
 CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({cv.slug: INGETEAM_MODBUS_SCHEMA})}, extra=vol.ALLOW_EXTRA)
 
+def _within_register_space(data: dict) -> dict:
+    """Reject writes running past the last holding register."""
+    if data[ATTR_ADDRESS] + len(data[ATTR_VALUES]) > 0x10000:
+        raise vol.Invalid("values run past register 65535")
+    return data
+
+
+WRITE_REGISTERS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_HUB): cv.string,
+            vol.Required(ATTR_ADDRESS): vol.All(vol.Coerce(int), vol.Range(min=0, max=0xFFFF)),
+            vol.Required(ATTR_VALUES): vol.All(
+                cv.ensure_list, vol.Length(min=1), [vol.All(vol.Coerce(int), vol.Range(min=0, max=0xFFFF))]
+            ),
+        }
+    ),
+    _within_register_space,
+)
+
 PLATFORMS = ["sensor"]
 
 
 async def async_setup(hass, config):
     """Set up the Ingeteam modbus component."""
     hass.data[DOMAIN] = {}
+
+    async def async_write_registers(call: ServiceCall) -> None:
+        """Write holding registers on the given hub."""
+        hub_name = call.data[ATTR_HUB]
+        if hub_name not in hass.data[DOMAIN]:
+            raise HomeAssistantError(f"Unknown Ingeteam hub: {hub_name}")
+        hub: "IngeteamModbusHub" = hass.data[DOMAIN][hub_name]["hub"]
+        if not await hub.async_write_registers(call.data[ATTR_ADDRESS], call.data[ATTR_VALUES]):
+            raise HomeAssistantError(
+                f"Write to {hub_name} register {call.data[ATTR_ADDRESS]} could not be verified"
+            )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_WRITE_REGISTERS, async_write_registers, schema=WRITE_REGISTERS_SCHEMA
+    )
     return True
 
 
@@ -69,9 +130,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     name = entry.data[CONF_NAME]
     port = entry.data[CONF_PORT]
     address = entry.data.get(CONF_MODBUS_ADDRESS, 1)
-    scan_interval = entry.data[CONF_SCAN_INTERVAL]
-    read_meter = entry.data.get(CONF_READ_METER, False)
-    read_battery = entry.data.get(CONF_READ_BATTERY, False)
+    # Settings changed through the options flow take precedence over the initial setup
+    config = {**entry.data, **entry.options}
+    scan_interval = config[CONF_SCAN_INTERVAL]
+    read_meter = config.get(CONF_READ_METER, False)
+    read_battery = config.get(CONF_READ_BATTERY, False)
+    watch_interval = config.get(CONF_WATCH_INTERVAL, DEFAULT_WATCH_INTERVAL)
+    expose_metrics = config.get(CONF_EXPOSE_METRICS, DEFAULT_EXPOSE_METRICS)
+    timeout = config.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+
+    if CONF_CAPABILITIES not in entry.data:
+        # Entries created before probing existed: probe once and keep the result. The
+        # register groups the user configured stay as they are; they decide both what
+        # is read and which entities exist.
+        try:
+            # These entries have always been decoded with the default profile, so keep
+            # it when the model is not recognised
+            probe = await hass.async_add_executor_job(
+                probe_device, host, port, address, PROFILE_AUTO, DEFAULT_PROFILE
+            )
+        except ProbeError as e:
+            _LOGGER.warning("Could not probe %s, using the configured register groups: %s", host, e)
+        else:
+            hass.config_entries.async_update_entry(entry, data={**entry.data, **probe})
+            capabilities = probe[CONF_CAPABILITIES]
+            if (capabilities[CAPABILITY_METER], capabilities[CAPABILITY_BATTERY]) != (read_meter, read_battery):
+                _LOGGER.info(
+                    "%s reports meter=%s, battery=%s but meter=%s, battery=%s are configured; "
+                    "change it from the integration options if needed",
+                    name,
+                    capabilities[CAPABILITY_METER],
+                    capabilities[CAPABILITY_BATTERY],
+                    read_meter,
+                    read_battery,
+                )
 
     _LOGGER.debug("Setup %s.%s", DOMAIN, name)
 
@@ -84,17 +176,59 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         scan_interval,
         read_meter,
         read_battery,
+        watch_interval,
+        timeout=timeout,
+        profile=get_profile(entry.data.get(CONF_PROFILE)),
     )
 
     """Register the hub."""
-    hass.data[DOMAIN][name] = {"hub": hub}
+    hass.data[DOMAIN][name] = {"hub": hub, "metrics": expose_metrics}
+    _async_register_metrics_view(hass, expose_metrics)
+
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running hub.
+
+    Enabling or disabling a register group changes the set of entities, so the
+    entry is reloaded; existing entities keep their unique ids and history.
+    Everything else is applied live.
+    """
+    name = entry.data[CONF_NAME]
+    config = {**entry.data, **entry.options}
+    hub: "IngeteamModbusHub" = hass.data[DOMAIN][name]["hub"]
+    read_meter = config.get(CONF_READ_METER, False)
+    read_battery = config.get(CONF_READ_BATTERY, False)
+    if (read_meter, read_battery) != (hub.read_meter, hub.read_battery):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    hub.async_reconfigure(
+        scan_interval=config[CONF_SCAN_INTERVAL],
+        read_meter=read_meter,
+        read_battery=read_battery,
+        watch_interval=config.get(CONF_WATCH_INTERVAL, DEFAULT_WATCH_INTERVAL),
+        timeout=config.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
+    )
+    expose_metrics = config.get(CONF_EXPOSE_METRICS, DEFAULT_EXPOSE_METRICS)
+    hass.data[DOMAIN][name]["metrics"] = expose_metrics
+    _async_register_metrics_view(hass, expose_metrics)
+
+
+@callback
+def _async_register_metrics_view(hass: HomeAssistant, expose_metrics: bool) -> None:
+    """Register the metrics view the first time a hub enables it."""
+    if expose_metrics and DATA_METRICS_VIEW not in hass.data:
+        hass.data[DATA_METRICS_VIEW] = IngeteamMetricsView()
+        hass.http.register_view(hass.data[DATA_METRICS_VIEW])
+
+
 async def async_unload_entry(hass, entry):
     """Unload Ingeteam mobus entry."""
     hub: "IngeteamModbusHub" = hass.data[DOMAIN][entry.data["name"]]["hub"]
+    hub.cancel_writes()
     hub.close()
 
     unload_ok = all(
@@ -112,10 +246,26 @@ async def async_unload_entry(hass, entry):
 class IngeteamModbusHub:
     """Thread safe wrapper class for pymodbus."""
 
-    def __init__(self, hass, name, host, port, address, scan_interval, read_meter=True, read_battery=False):
+    def __init__(
+        self,
+        hass,
+        name,
+        host,
+        port,
+        address,
+        scan_interval,
+        read_meter=True,
+        read_battery=False,
+        watch_interval=0,
+        timeout=0,
+        profile=None,
+    ):
         """Initialize the Modbus hub."""
         self._hass = hass
-        self._client = ModbusTcpClient(host=host, port=port, timeout=max(3, (scan_interval - 1)))
+        # No retries: a request holds the client lock, so its timeout is the longest it can block
+        self._client = ModbusTcpClient(
+            host=host, port=port, timeout=self._request_timeout(scan_interval, timeout), retries=0
+        )
         self._lock = threading.Lock()
         self._name = name
         self._address = address
@@ -123,57 +273,257 @@ class IngeteamModbusHub:
         self._port = port
         self.read_meter = read_meter
         self.read_battery = read_battery
+        self.profile = profile or get_profile(None)
+        self._read_plan = self._build_read_plan(read_battery, read_meter)
         self._scan_interval = timedelta(seconds=scan_interval)
-        self._unsub_interval_method = None
+        self._coordinator = None
+        # Poll scheduling: at most one poll in flight, results arriving after the next tick are dropped
+        self.poll_tracker = PollTracker(scan_interval, time.monotonic())
+        self._poll_lease = None
+        self._poll_listeners = []
+        # Watch tier: status/alarm registers only, polled faster than the full read
+        self._watch_interval = timedelta(seconds=watch_interval) if watch_interval else None
+        self._unsub_watch_method = None
+        self._watch_lease = None
+        self._watch_values = {}
         self._sensors = []
-        self.data = {}
+        self._validator = SampleValidator(SANITY_LIMITS)
+        # Latest decoded data; replaced as a whole, never mutated
+        self._snapshot = IngeteamSnapshot({})
+        self._writes = WriteCoalescer(hass.loop, self._async_send_writes)
 
     @callback
     def async_add_ingeteam_sensor(self, update_callback):
         """Listen for data updates."""
         if not self._sensors:
             self.connect()
-            self._unsub_interval_method = async_track_time_interval(
-                self._hass, self.async_refresh_modbus_data, self._scan_interval
-            )
+            self._coordinator = async_get_poll_coordinator(self._hass)
+            self._coordinator.async_register(self)
+            self._async_start_watch()
         self._sensors.append(update_callback)
 
     @callback
     def async_remove_ingeteam_sensor(self, update_callback):
         """Remove data update."""
         self._sensors.remove(update_callback)
-        if not self._sensors and self._unsub_interval_method:
-            self._unsub_interval_method()
-            self._unsub_interval_method = None
+        if not self._sensors and self._coordinator:
+            self._coordinator.async_unregister(self)
+            self._coordinator = None
+            self._async_stop_watch()
             self.close()
 
+    @callback
+    def _async_start_watch(self) -> None:
+        if self._watch_interval:
+            self._unsub_watch_method = async_track_time_interval(
+                self._hass, self.async_refresh_watch_data, self._watch_interval
+            )
+
+    @callback
+    def _async_stop_watch(self) -> None:
+        if self._unsub_watch_method:
+            self._unsub_watch_method()
+            self._unsub_watch_method = None
+
+    @callback
+    def async_reconfigure(self, scan_interval, read_meter, read_battery, watch_interval, timeout) -> None:
+        """Apply new polling settings live.
+
+        The socket stays open and entities are kept; the read plan is swapped as a
+        whole so a poll already running finishes with the plan it started with.
+        """
+        self._client.comm_params.timeout_connect = self._request_timeout(scan_interval, timeout)
+        self.read_meter = read_meter
+        self.read_battery = read_battery
+        self._read_plan = self._build_read_plan(read_battery, read_meter)
+
+        interval = timedelta(seconds=scan_interval)
+        if interval != self._scan_interval:
+            coordinator = self._coordinator
+            if coordinator:
+                coordinator.async_unregister(self)
+            self._scan_interval = interval
+            self.poll_tracker.set_interval(scan_interval, time.monotonic())
+            if coordinator:
+                coordinator.async_register(self, poll_now=False)
+
+        watch = timedelta(seconds=watch_interval) if watch_interval else None
+        if watch != self._watch_interval:
+            self._watch_interval = watch
+            if self._coordinator:
+                self._async_stop_watch()
+                self._async_start_watch()
+        _LOGGER.debug("Reconfigured %s: every %s, read plan %s", self._name, interval, self._read_plan[0])
+
     async def async_refresh_modbus_data(self, _now: Optional[int] = None) -> None:
-        """Time to update."""
-        if not self._sensors:
+        """Time to update.
+
+        The deadline of a poll is the next tick. A tick that finds the previous poll
+        still running marks it late: a poll still waiting for a domain-wide slot gives
+        up, and one already reading gives its slot back and runs to completion, but
+        its result is never published. Further ticks it spans are counted as missed.
+        """
+        if not self._sensors or self._coordinator is None:
+            return
+        tracker = self.poll_tracker
+        if not tracker.tick():
+            self._poll_lease.expire()
+            _LOGGER.debug("Poll of %s has not finished by the next tick, dropping it", self._name)
+            self._async_notify_poll_stats()
             return
-        update_result = await self._hass.async_add_executor_job(self._update_modbus_data)
-        if update_result:
+
+        lease = self._poll_lease = SlotLease(self._coordinator.poll_slots)
+        started = time.monotonic()
+        if not await lease.acquire():
+            tracker.abandon()
+            _LOGGER.debug("No poll slot free for %s before its next tick", self._name)
+            return
+        try:
+            snapshot = await self._hass.async_add_executor_job(self._update_modbus_data)
+        finally:
+            lease.release()
+        finished = time.monotonic()
+        if tracker.finish(snapshot is not None, finished - started, finished):
+            self._snapshot = snapshot
             for update_callback in self._sensors:
                 update_callback()
+        self._async_notify_poll_stats()
 
-    def _update_modbus_data(self) -> bool:
-        """Synchronously fetch data from the modbus device. To be run in an executor."""
+    @callback
+    def async_add_poll_listener(self, update_callback) -> None:
+        """Listen for the outcome of every tick, including those publishing no data."""
+        self._poll_listeners.append(update_callback)
+
+    @callback
+    def async_remove_poll_listener(self, update_callback) -> None:
+        """Remove a tick outcome listener."""
+        self._poll_listeners.remove(update_callback)
+
+    @callback
+    def _async_notify_poll_stats(self) -> None:
+        for update_callback in self._poll_listeners:
+            update_callback()
+
+    @property
+    def poll_rate(self) -> Optional[float]:
+        """Return the rate of published polls per second over the recent intervals."""
+        return self.poll_tracker.rate(time.monotonic())
+
+    @property
+    def poll_stats(self) -> dict:
+        """Return the poll scheduling counters."""
+        tracker = self.poll_tracker
+        rate = self.poll_rate
+        duration = tracker.last_poll_duration
+        return {
+            "poll_rate": round(rate, 3) if rate is not None else None,
+            "poll_duration": round(duration * 1000) if duration is not None else None,
+            "missed_ticks": tracker.missed_ticks,
+            "late_polls": tracker.late_polls,
+            "failed_polls": tracker.failed_polls,
+        }
+
+    def _update_modbus_data(self) -> Optional[IngeteamSnapshot]:
+        """Synchronously fetch data from the modbus device and build the next snapshot.
+
+        To be run in an executor.
+        """
         if not self._check_and_reconnect():
-            return False
+            return None
         try:
-            return self.read_modbus_data()
+            data = self.read_modbus_data()
+            if data is None:
+                return None
+            return self._snapshot.evolve(data, time.time())
         except ModbusException as e:
             _LOGGER.warning("Modbus exception occurred while reading data: %s", e)
-            return False
+            return None
         except Exception:
             _LOGGER.exception("Unexpected error while reading modbus data")
-            return False
+            return None
+
+    async def async_refresh_watch_data(self, _now: Optional[int] = None) -> None:
+        """Read the status/alarm registers and fire an event for every transition."""
+        if not self._sensors or self._coordinator is None:
+            return
+        if self._watch_lease is not None:
+            # Still running at the next watch tick: give its slot to the other hubs
+            self._watch_lease.expire()
+            return
+        lease = self._watch_lease = SlotLease(self._coordinator.poll_slots)
+        try:
+            if not await lease.acquire():
+                return
+            values = await self._hass.async_add_executor_job(self._update_watch_data)
+        finally:
+            lease.release()
+            self._watch_lease = None
+        if values is None:
+            return
+        previous, self._watch_values = self._watch_values, values
+        if not previous:
+            return
+        for key, value in values.items():
+            old_value = previous.get(key)
+            if old_value == value:
+                continue
+            event_data = {"hub": self._name, "key": key, "old_value": old_value, "new_value": value}
+            decoder = self.profile.watch_decoders.get(key)
+            if isinstance(decoder, BitfieldDecoder):
+                active = decoder(value)
+                was_active = decoder(old_value)
+                event_data["active"] = list(active)
+                event_data["raised"] = [label for label in active if label not in was_active]
+                event_data["cleared"] = [label for label in was_active if label not in active]
+            elif decoder is not None and old_value is not None:
+                event_data["old_state"] = decoder(old_value)
+                event_data["new_state"] = decoder(value)
+            self._hass.bus.async_fire(EVENT_STATUS_CHANGED, event_data)
+
+    def _update_watch_data(self) -> Optional[dict]:
+        """Synchronously read the watch registers. To be run in an executor."""
+        if not self._check_and_reconnect():
+            return None
+        try:
+            return self.read_watch_data()
+        except ModbusException as e:
+            _LOGGER.warning("Modbus exception occurred while reading status registers: %s", e)
+            return None
+        except Exception:
+            _LOGGER.exception("Unexpected error while reading status registers")
+            return None
+
+    def read_watch_data(self) -> Optional[dict]:
+        """Read only the status/alarm register blocks, returning raw codes by key."""
+        registers = [0] * self.profile.register_count
+        for start, count in self.profile.watch_blocks:
+            response = self.read_input_registers(unit=self._address, address=start, count=count)
+            if response.isError() or len(response.registers) < count:
+                _LOGGER.debug("Error reading status registers %s-%s: %s", start, start + count - 1, response)
+                return None
+            registers[start:start + count] = response.registers
+        return self.profile.read_raw(registers, self.profile.watch_keys)
 
     @property
     def name(self):
         """Return the name of this hub."""
         return self._name
 
+    @property
+    def data(self) -> IngeteamSnapshot:
+        """Return the snapshot of the latest published poll."""
+        return self._snapshot
+
+    @property
+    def scan_interval(self) -> timedelta:
+        """Return the full poll interval."""
+        return self._scan_interval
+
+    @property
+    def rejected_samples(self) -> dict:
+        """Return the number of rejected samples by field."""
+        return self._validator.rejected
+
     def close(self):
         """Disconnect client."""
         with self._lock:
@@ -202,136 +552,107 @@ class IngeteamModbusHub:
         with self._lock:
             return self._client.read_input_registers(address=address, count=count, device_id=unit)
 
+    def read_holding_registers(self, unit, address, count):
+        """Read holding registers."""
+        with self._lock:
+            return self._client.read_holding_registers(address=address, count=count, device_id=unit)
+
+    def write_registers(self, unit, address, values):
+        """Write multiple holding registers (FC16)."""
+        with self._lock:
+            return self._client.write_registers(address=address, values=values, device_id=unit)
+
     # -------------------------
-    # Utilidades de decodificación
+    # Escritura de consignas
     # -------------------------
-    @staticmethod
-    def _decode_signed(value: int) -> int:
-        """Decode a 16-bit signed integer (two's complement)."""
-        if value & 0x8000:
-            return value - 0x10000
-        return value
+    async def async_write_registers(self, address: int, values) -> bool:
+        """Queue holding register values and wait until the batch holding them is verified.
 
-    @staticmethod
-    def _u32_from_words_le(registers, start_index: int) -> int:
+        Writes arriving within WRITE_COALESCE_DELAY are merged; when the same register
+        is written several times only the last value is sent.
         """
-        Combina dos registros de 16 bits en un uint32.
-        Orden de palabras 'little' (wordorder LITTLE): low word primero.
-        Cada palabra mantiene su endianness de bytes (como en BIG del decoder original),
-        por lo que basta con desplazar 16 bits la palabra alta.
+        if isinstance(values, int):
+            values = [values]
+        return await self._writes.write(address, values)
+
+    @callback
+    def cancel_writes(self) -> None:
+        """Drop pending writes, releasing anyone waiting on them."""
+        self._writes.cancel()
+
+    async def _async_send_writes(self, batches) -> dict:
+        return await self._hass.async_add_executor_job(self._write_batches, batches)
+
+    def _write_batches(self, batches) -> dict:
+        """Write and read back each batch. To be run in an executor.
+
+        The lock is taken per request, so a poll waiting on it runs between batches
+        instead of behind the whole write. Returns the read-back value by address.
         """
-        low = registers[start_index]
-        high = registers[start_index + 1]
-        return (high << 16) | low
+        readback_values = {}
+        if not self._check_and_reconnect():
+            return readback_values
+        for start, values in batches:
+            try:
+                result = self.write_registers(self._address, start, values)
+                if result.isError():
+                    _LOGGER.error("Error writing registers %s-%s: %s", start, start + len(values) - 1, result)
+                    continue
+                readback = self.read_holding_registers(self._address, start, len(values))
+                if readback.isError():
+                    _LOGGER.error("Error reading back registers %s-%s: %s", start, start + len(values) - 1, readback)
+                    continue
+            except ModbusException as e:
+                _LOGGER.warning("Modbus exception occurred while writing registers: %s", e)
+                continue
+            for offset, value in enumerate(values):
+                actual = readback.registers[offset]
+                readback_values[start + offset] = actual
+                if actual != value:
+                    _LOGGER.warning(
+                        "Register %s read back %s after writing %s", start + offset, actual, value
+                    )
+        return readback_values
 
     # -------------------------
     # Lectura y parseo principal
     # -------------------------
-    def read_modbus_data(self) -> bool:
-        """Read and decode all registers in a single, optimized function."""
-        all_regs_response = self.read_input_registers(unit=self._address, address=0, count=81)
-        if all_regs_response.isError():
-            _LOGGER.error("Error reading modbus registers: %s", all_regs_response)
-            return False
-
-        registers = all_regs_response.registers
-        if len(registers) < 81:
-            _LOGGER.warning(
-                "Incomplete Modbus response, expected 81 registers but got %s", len(registers)
-            )
-            return False
-
-        # --- Inverter Status & Lifetime ---
-        # Antes usabas BinaryPayloadDecoder con byteorder=BIG, wordorder=LITTLE (dos registros: 30007-30008)
-        self.data["total_operation_time"] = self._u32_from_words_le(registers, 6)  # Reg 30007-8
-
-        self.data["stop_code"] = registers[9]  # Reg 30010
-
-        # Alarm code (30011-30012) → mismo esquema de 32 bits
-        self.data["alarm_code"] = self._u32_from_words_le(registers, 10)  # Reg 30011-12
-
-        status_code = registers[15]  # Reg 30016
-        self.data["status"] = INVERTER_STATUS.get(status_code, f"Unknown ({status_code})")
-        self.data["waiting_time"] = registers[16]  # Reg 30017
-
-        # --- Battery Data ---
-        self.data["battery_voltage"] = registers[17] / 10.0
-        self.data["battery_current"] = self._decode_signed(registers[18]) / 100.0
-        battery_power = self._decode_signed(registers[19])
-        self.data["battery_discharging_power"] = max(0, battery_power)
-        self.data["battery_charging_power"] = max(0, -battery_power)
-        self.data["battery_state_of_charge"] = registers[20]
-        self.data["battery_state_of_health"] = registers[21]
-        self.data["battery_charging_voltage"] = registers[22] / 10.0
-        self.data["battery_discharging_voltage"] = registers[23] / 10.0
-        self.data["battery_charging_current_max"] = registers[24] / 100.0
-        self.data["battery_discharging_current_max"] = registers[25] / 100.0
-        batt_status_code = registers[26]
-        self.data["battery_status"] = BATTERY_STATUS.get(batt_status_code, f"Unknown ({batt_status_code})")
-        self.data["battery_temp"] = self._decode_signed(registers[27]) / 10.0
-        self.data["battery_bms_alarm"] = registers[28]
-        batt_limit_code = registers[29]
-        self.data["battery_discharge_limitation_reason"] = BATTERY_LIMITATION_REASONS.get(
-            batt_limit_code, f"Unknown ({batt_limit_code})"
-        )
-        self.data["battery_voltage_internal"] = registers[30] / 10.0
-        self.data["battery_bms_flags"] = registers[68]  # Reg 30069
-        self.data["battery_bms_warnings"] = registers[73]  # Reg 30074
-        self.data["battery_bms_errors"] = registers[74]  # Reg 30075
-        self.data["battery_bms_faults"] = registers[75]  # Reg 30076
-        self.data["battery_charge_limitation_reason"] = registers[77]  # Reg 30078
-
-        # --- PV Data ---
-        self.data["pv1_voltage"] = registers[31]
-        self.data["pv1_current"] = registers[32] / 100.0
-        self.data["pv1_power"] = registers[33]
-        self.data["pv2_voltage"] = registers[34]
-        self.data["pv2_current"] = registers[35] / 100.0
-        self.data["pv2_power"] = registers[36]
-        self.data["external_pv_power"] = registers[79]
-        self.data["ev_power"] = self._decode_signed(registers[80])
-        self.data["pv_internal_total_power"] = self.data.get("pv1_power", 0) + self.data.get("pv2_power", 0)
-        self.data["pv_total_power"] = self.data["pv_internal_total_power"] + self.data.get("external_pv_power", 0)
-
-        # --- Inverter & Loads Data ---
-        self.data["active_power"] = self._decode_signed(registers[37])
-        self.data["reactive_power"] = self._decode_signed(registers[38])
-        self.data["power_factor"] = self._decode_signed(registers[39]) / 1000.0
-        self.data["ap_reduction_ratio"] = registers[40] / 10.0
-        ap_reason_code = registers[41]
-        self.data["ap_reduction_reason"] = AP_REDUCTION_REASONS.get(ap_reason_code, f"Unknown ({ap_reason_code})")
-        self.data["reactive_setpoint_type"] = registers[42]
-        self.data["cl_voltage"] = registers[43]
-        self.data["cl_current"] = registers[44] / 100.0
-        self.data["cl_freq"] = registers[45] / 100.0
-        self.data["cl_active_power"] = self._decode_signed(registers[46])
-        self.data["cl_reactive_power"] = self._decode_signed(registers[47])
-        self.data["total_loads_power"] = registers[78]
-        self.data["dc_bus_voltage"] = registers[54]
-        self.data["positive_isolation_resistance"] = registers[59]  # Reg 30060
-        self.data["negative_isolation_resistance"] = registers[60]  # Reg 30061
-        self.data["temp_mod_1"] = self._decode_signed(registers[55]) / 10.0
-        self.data["temp_mod_2"] = self._decode_signed(registers[56]) / 10.0
-        self.data["temp_pcb"] = self._decode_signed(registers[57]) / 10.0
-        self.data["rms_diff_current"] = registers[61] / 10.0
-        self.data["do_1_status"] = BOOLEAN_STATUS.get(registers[62], "Unknown")
-        self.data["do_2_status"] = BOOLEAN_STATUS.get(registers[63], "Unknown")
-        self.data["di_drm_status"] = BOOLEAN_STATUS.get(registers[64], "Unknown")
-        self.data["di_2_status"] = BOOLEAN_STATUS.get(registers[65], "Unknown")
-        self.data["di_3_status"] = BOOLEAN_STATUS.get(registers[66], "Unknown")
-
-        # --- Meter Data ---
-        self.data["im_voltage"] = registers[48]
-        self.data["im_current"] = registers[49] / 100.0
-        self.data["im_freq"] = registers[50] / 100.0
-        self.data["im_active_power"] = self._decode_signed(registers[51])
-        self.data["im_reactive_power"] = self._decode_signed(registers[52])
-        self.data["im_power_factor"] = self._decode_signed(registers[53]) / 1000.0
-        self.data["em_voltage"] = registers[69]
-        self.data["em_freq"] = registers[70] / 10.0
-        grid_power = self._decode_signed(registers[71])
-        self.data["em_active_power"] = max(0, grid_power)
-        self.data["em_active_power_returned"] = max(0, -grid_power)
-        self.data["em_reactive_power"] = self._decode_signed(registers[72])
-
-        return True
+    @staticmethod
+    def _request_timeout(scan_interval, timeout) -> float:
+        """Return the configured request timeout, or one that fits within the scan interval."""
+        # A poll has one scan interval to finish, so a request (sent once, without
+        # retries) must time out well within it
+        return timeout or max(1, scan_interval - 1)
+
+    def _build_read_plan(self, read_battery, read_meter) -> tuple:
+        """Return (blocks, groups) for the enabled register groups of the profile."""
+        groups = ["inverter"]
+        if read_battery:
+            groups.append("battery")
+        if read_meter:
+            groups.append("meter")
+        return self.profile.read_plan(groups), tuple(groups)
+
+    def read_modbus_data(self) -> Optional[dict]:
+        """Read the blocks of the read plan and decode the enabled register groups."""
+        blocks, groups = self._read_plan
+        registers = [0] * self.profile.register_count
+        for start, count in blocks:
+            response = self.read_input_registers(unit=self._address, address=start, count=count)
+            if response.isError():
+                _LOGGER.error("Error reading modbus registers %s-%s: %s", start, start + count - 1, response)
+                return None
+            if len(response.registers) < count:
+                _LOGGER.warning(
+                    "Incomplete Modbus response, expected %s registers but got %s", count, len(response.registers)
+                )
+                return None
+            registers[start:start + count] = response.registers
+
+        data = self.profile.decode(registers, groups)
+
+        # --- Validation, then values derived from validated fields ---
+        self._validator.apply(data)
+        self.profile.derive(data)
+
+        return data
@@ -14,9 +14,22 @@ from .const import (
     CONF_MODBUS_ADDRESS,
     CONF_READ_METER,
     CONF_READ_BATTERY,
+    CONF_WATCH_INTERVAL,
+    CONF_EXPOSE_METRICS,
+    CONF_CAPABILITIES,
+    CAPABILITY_METER,
+    CAPABILITY_BATTERY,
+    CONF_TIMEOUT,
+    CONF_PROFILE,
+    PROFILE_AUTO,
     DEFAULT_READ_METER,
     DEFAULT_READ_BATTERY,
+    DEFAULT_TIMEOUT,
+    DEFAULT_WATCH_INTERVAL,
+    DEFAULT_EXPOSE_METRICS,
 )
+from .probe import ProbeError, UnknownModelError, probe_device
+from .profiles import PROFILES
 from homeassistant.core import HomeAssistant, callback
 
 DATA_SCHEMA = vol.Schema(
@@ -25,9 +38,10 @@ DATA_SCHEMA = vol.Schema(
         vol.Required(CONF_HOST): str,
         vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
         vol.Optional(CONF_MODBUS_ADDRESS, default=DEFAULT_MODBUS_ADDRESS): int,
-        vol.Optional(CONF_READ_METER, default=DEFAULT_READ_METER): bool,
-        vol.Optional(CONF_READ_BATTERY, default=DEFAULT_READ_BATTERY): bool,
+        vol.Optional(CONF_PROFILE, default=PROFILE_AUTO): vol.In([PROFILE_AUTO, *PROFILES]),
         vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
+        vol.Optional(CONF_WATCH_INTERVAL, default=DEFAULT_WATCH_INTERVAL): vol.All(int, vol.Range(min=0)),
+        vol.Optional(CONF_EXPOSE_METRICS, default=DEFAULT_EXPOSE_METRICS): bool,
     }
 )
 
@@ -56,6 +70,12 @@ class IngeteamModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Get the options flow for this handler."""
+        return IngeteamModbusOptionsFlow(config_entry)
+
     def _host_in_configuration_exists(self, host) -> bool:
         """Return True if host exists in configuration."""
         if host in ingeteam_modbus_entries(self.hass):
@@ -65,6 +85,7 @@ class IngeteamModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
         errors = {}
+        placeholders = {"model": "-"}
 
         if user_input is not None:
             host = user_input[CONF_HOST]
@@ -76,11 +97,70 @@ class IngeteamModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 await self.async_set_unique_id(user_input[CONF_HOST])
                 self._abort_if_unique_id_configured()
-                return self.async_create_entry(
-                    title=user_input[CONF_NAME], data=user_input
-                )
+                try:
+                    probe = await self.hass.async_add_executor_job(
+                        probe_device,
+                        host,
+                        user_input[CONF_PORT],
+                        user_input[CONF_MODBUS_ADDRESS],
+                        user_input[CONF_PROFILE],
+                    )
+                except UnknownModelError as e:
+                    errors[CONF_PROFILE] = "unknown_model"
+                    placeholders["model"] = e.model or "not reported"
+                except ProbeError:
+                    errors["base"] = "cannot_connect"
+                else:
+                    capabilities = probe[CONF_CAPABILITIES]
+                    return self.async_create_entry(
+                        title=user_input[CONF_NAME],
+                        data={
+                            **user_input,
+                            **probe,
+                            CONF_READ_METER: capabilities[CAPABILITY_METER],
+                            CONF_READ_BATTERY: capabilities[CAPABILITY_BATTERY],
+                        },
+                    )
 
         return self.async_show_form(
-            step_id="user", data_schema=DATA_SCHEMA, errors=errors
+            step_id="user", data_schema=DATA_SCHEMA, errors=errors, description_placeholders=placeholders
         )
 
+
+class IngeteamModbusOptionsFlow(config_entries.OptionsFlow):
+    """Ingeteam Modbus options flow; changes are applied to the running hub."""
+
+    def __init__(self, config_entry):
+        """Initialize the options flow."""
+        # Kept here rather than in config_entry, which the framework only sets from 2024.11
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Manage the polling options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        config = {**self._entry.data, **self._entry.options}
+        options_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SCAN_INTERVAL, default=config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Optional(
+                    CONF_READ_METER, default=config.get(CONF_READ_METER, DEFAULT_READ_METER)
+                ): bool,
+                vol.Optional(
+                    CONF_READ_BATTERY, default=config.get(CONF_READ_BATTERY, DEFAULT_READ_BATTERY)
+                ): bool,
+                vol.Optional(
+                    CONF_WATCH_INTERVAL, default=config.get(CONF_WATCH_INTERVAL, DEFAULT_WATCH_INTERVAL)
+                ): vol.All(int, vol.Range(min=0)),
+                vol.Optional(
+                    CONF_TIMEOUT, default=config.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_EXPOSE_METRICS, default=config.get(CONF_EXPOSE_METRICS, DEFAULT_EXPOSE_METRICS)
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=options_schema)
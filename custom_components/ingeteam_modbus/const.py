@@ -5,12 +5,63 @@ DEFAULT_PORT = 502
 DEFAULT_MODBUS_ADDRESS = 1
 DEFAULT_READ_METER = False
 DEFAULT_READ_BATTERY = False
+DEFAULT_WATCH_INTERVAL = 0
+DEFAULT_EXPOSE_METRICS = False
+DEFAULT_TIMEOUT = 0
 CONF_INGETEAM_HUB = "ingeteam_hub"
 ATTR_STATUS_DESCRIPTION = "status_description"
+ATTR_ACTIVE_FLAGS = "active_flags"
+ATTR_REJECTED_SAMPLES = "rejected_samples"
 ATTR_MANUFACTURER = "Ingeteam"
 CONF_MODBUS_ADDRESS = "modbus_address"
 CONF_READ_METER = "read_meter"
 CONF_READ_BATTERY = "read_battery"
+CONF_WATCH_INTERVAL = "watch_interval"
+CONF_EXPOSE_METRICS = "expose_metrics"
+CONF_TIMEOUT = "timeout"
+CONF_CAPABILITIES = "capabilities"
+CONF_FIRMWARE = "firmware_version"
+CONF_MODEL = "model"
+CONF_PROFILE = "profile"
+
+PROFILE_AUTO = "auto"
+
+CAPABILITY_BATTERY = "battery"
+CAPABILITY_METER = "meter"
+
+PROBE_TIMEOUT = 5
+
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+DATA_METRICS_VIEW = f"{DOMAIN}_metrics_view"
+
+EVENT_STATUS_CHANGED = "ingeteam_modbus_status_changed"
+
+# A step larger than a field's max_step is accepted after this many consecutive polls
+SANITY_CONFIRM_SAMPLES = 3
+
+DATA_POLL_COORDINATOR = f"{DOMAIN}_poll_coordinator"
+# Max reads in flight at once across all hubs
+MAX_CONCURRENT_POLLS = 8
+
+# Number of scan intervals over which the achieved poll rate is measured
+POLL_RATE_WINDOW = 20
+
+# Blocks closer than this many registers are read in one request; a round trip
+# costs far more than reading a few unused registers
+READ_PLAN_MAX_GAP = 20
+# The watch tier reads only the status/alarm registers, so it splits on smaller gaps
+WATCH_PLAN_MAX_GAP = 8
+READ_MAX_COUNT = 125
+
+SERVICE_WRITE_REGISTERS = "write_registers"
+ATTR_HUB = "hub"
+ATTR_ADDRESS = "address"
+ATTR_VALUES = "values"
+
+# Writes requested within this window (seconds) are coalesced into one batch
+WRITE_COALESCE_DELAY = 0.25
+# Max registers per Write Multiple Registers (FC16) request
+WRITE_MAX_BATCH = 123
 
 INVERTER_STATUS_TYPES = {
     "Stop_Event": ["Stop event code", "stop_code", None, None],
@@ -55,6 +106,14 @@ INVERTER_SENSOR_TYPES = {
     "DI_3_Status": ["Digital Input 3. Status", "di_3_status", None, None],
 }
 
+POLL_SENSOR_TYPES = {
+    "Poll_Rate": ["Poll Rate", "poll_rate", "polls/s", "mdi:timer-sync-outline"],
+    "Poll_Duration": ["Poll Duration", "poll_duration", "ms", "mdi:timer-outline"],
+    "Missed_Ticks": ["Missed Poll Ticks", "missed_ticks", None, "mdi:timer-off-outline"],
+    "Late_Polls": ["Late Polls", "late_polls", None, "mdi:timer-alert-outline"],
+    "Failed_Polls": ["Failed Polls", "failed_polls", None, "mdi:timer-remove-outline"],
+}
+
 METER_SENSOR_TYPES = {
     "EM_Voltage": ["External Meter AC Voltage", "em_voltage", "V", "mdi:sine-wave"],
     "EM_Frequency": ["External Meter AC Frequency", "em_freq", "Hz", None],
@@ -102,10 +161,137 @@ BATTERY_SENSOR_TYPES = {
     "Battery_Status": ["Battery Status", "battery_status", None, None],
     "Battery_Temp": ["Battery Temp", "battery_temp", "C", None],
     "Battery_BMS_Alarm": ["Battery BMS Alarm", "battery_bms_alarm", None, None],
+    "Battery_BMS_Flags": ["Battery BMS Flags", "battery_bms_flags", None, None],
+    "Battery_BMS_Warnings": ["Battery BMS Warnings", "battery_bms_warnings", None, None],
+    "Battery_BMS_Errors": ["Battery BMS Errors", "battery_bms_errors", None, None],
+    "Battery_BMS_Faults": ["Battery BMS Faults", "battery_bms_faults", None, None],
     "Battery_Discharch_Limitation": ["Battery Discharge Limitation Reason", "battery_discharge_limitation_reason", None, None],
     "Battery_Voltage_Internal": ["Battery Voltage Internal Sensor", "battery_voltage_internal", "V", None],
 }
 
+# Sanity limits applied to decoded values before publishing
+# [min, max, max_step per poll (None = no limit), median window (0 = off)]
+SANITY_LIMITS = {
+    "battery_voltage": [0, 1000, None, 0],
+    "battery_voltage_internal": [0, 1000, None, 0],
+    "battery_current": [-300, 300, None, 0],
+    "battery_power": [-30000, 30000, None, 0],
+    "battery_state_of_charge": [0, 100, 20, 0],
+    "battery_state_of_health": [0, 100, None, 0],
+    "battery_temp": [-40, 100, None, 0],
+    "pv1_voltage": [0, 1500, None, 0],
+    "pv2_voltage": [0, 1500, None, 0],
+    "pv1_power": [0, 30000, None, 0],
+    "pv2_power": [0, 30000, None, 0],
+    "external_pv_power": [0, 30000, None, 0],
+    "active_power": [-30000, 30000, None, 0],
+    "cl_voltage": [0, 500, None, 0],
+    "cl_freq": [0, 70, None, 0],
+    "im_voltage": [0, 500, None, 0],
+    "im_freq": [0, 70, None, 0],
+    "em_voltage": [0, 500, None, 0],
+    "em_freq": [0, 70, None, 0],
+    # Median of 3 drops the single-poll sign flips seen on the external meter
+    "em_grid_power": [-30000, 30000, None, 3],
+    "total_loads_power": [0, 30000, None, 0],
+    "temp_mod_1": [-40, 150, None, 0],
+    "temp_mod_2": [-40, 150, None, 0],
+    "temp_pcb": [-40, 150, None, 0],
+}
+
+# Input register map of single-phase hybrid inverters (1Play), Ingeteam doc ABH2010IMB08
+# key: [register offset, type, scale divisor, register group]
+# Types are u16, s16, u32 (low word first) or the name of an enum decoder
+SINGLE_PHASE_REGISTERS = {
+    # --- Inverter Status & Lifetime ---
+    "total_operation_time": [6, "u32", 1, "inverter"],  # Reg 30007-8
+    "stop_code": [9, "u16", 1, "inverter"],  # Reg 30010
+    "alarm_code": [10, "u32", 1, "inverter"],  # Reg 30011-12
+    "status": [15, "inverter_status", 1, "inverter"],  # Reg 30016
+    "waiting_time": [16, "u16", 1, "inverter"],  # Reg 30017
+    # --- PV Data ---
+    "pv1_voltage": [31, "u16", 1, "inverter"],
+    "pv1_current": [32, "u16", 100, "inverter"],
+    "pv1_power": [33, "u16", 1, "inverter"],
+    "pv2_voltage": [34, "u16", 1, "inverter"],
+    "pv2_current": [35, "u16", 100, "inverter"],
+    "pv2_power": [36, "u16", 1, "inverter"],
+    "external_pv_power": [79, "u16", 1, "inverter"],
+    "ev_power": [80, "s16", 1, "inverter"],
+    # --- Inverter & Loads Data ---
+    "active_power": [37, "s16", 1, "inverter"],
+    "reactive_power": [38, "s16", 1, "inverter"],
+    "power_factor": [39, "s16", 1000, "inverter"],
+    "ap_reduction_ratio": [40, "u16", 10, "inverter"],
+    "ap_reduction_reason": [41, "ap_reduction", 1, "inverter"],
+    "reactive_setpoint_type": [42, "u16", 1, "inverter"],
+    "cl_voltage": [43, "u16", 1, "inverter"],
+    "cl_current": [44, "u16", 100, "inverter"],
+    "cl_freq": [45, "u16", 100, "inverter"],
+    "cl_active_power": [46, "s16", 1, "inverter"],
+    "cl_reactive_power": [47, "s16", 1, "inverter"],
+    "total_loads_power": [78, "u16", 1, "inverter"],
+    "dc_bus_voltage": [54, "u16", 1, "inverter"],
+    "positive_isolation_resistance": [59, "u16", 1, "inverter"],  # Reg 30060
+    "negative_isolation_resistance": [60, "u16", 1, "inverter"],  # Reg 30061
+    "temp_mod_1": [55, "s16", 10, "inverter"],
+    "temp_mod_2": [56, "s16", 10, "inverter"],
+    "temp_pcb": [57, "s16", 10, "inverter"],
+    "rms_diff_current": [61, "u16", 10, "inverter"],
+    "do_1_status": [62, "boolean", 1, "inverter"],
+    "do_2_status": [63, "boolean", 1, "inverter"],
+    "di_drm_status": [64, "boolean", 1, "inverter"],
+    "di_2_status": [65, "boolean", 1, "inverter"],
+    "di_3_status": [66, "boolean", 1, "inverter"],
+    # --- Internal Meter Data ---
+    "im_voltage": [48, "u16", 1, "inverter"],
+    "im_current": [49, "u16", 100, "inverter"],
+    "im_freq": [50, "u16", 100, "inverter"],
+    "im_active_power": [51, "s16", 1, "inverter"],
+    "im_reactive_power": [52, "s16", 1, "inverter"],
+    "im_power_factor": [53, "s16", 1000, "inverter"],
+    # --- Battery Data ---
+    "battery_voltage": [17, "u16", 10, "battery"],
+    "battery_current": [18, "s16", 100, "battery"],
+    "battery_power": [19, "s16", 1, "battery"],
+    "battery_state_of_charge": [20, "u16", 1, "battery"],
+    "battery_state_of_health": [21, "u16", 1, "battery"],
+    "battery_charging_voltage": [22, "u16", 10, "battery"],
+    "battery_discharging_voltage": [23, "u16", 10, "battery"],
+    "battery_charging_current_max": [24, "u16", 100, "battery"],
+    "battery_discharging_current_max": [25, "u16", 100, "battery"],
+    "battery_status": [26, "battery_status", 1, "battery"],
+    "battery_temp": [27, "s16", 10, "battery"],
+    "battery_bms_alarm": [28, "u16", 1, "battery"],
+    "battery_discharge_limitation_reason": [29, "battery_limitation", 1, "battery"],
+    "battery_voltage_internal": [30, "u16", 10, "battery"],
+    "battery_bms_flags": [68, "u16", 1, "battery"],  # Reg 30069
+    "battery_bms_warnings": [73, "u16", 1, "battery"],  # Reg 30074
+    "battery_bms_errors": [74, "u16", 1, "battery"],  # Reg 30075
+    "battery_bms_faults": [75, "u16", 1, "battery"],  # Reg 30076
+    "battery_charge_limitation_reason": [77, "u16", 1, "battery"],  # Reg 30078
+    # --- External Meter Data ---
+    "em_voltage": [69, "u16", 1, "meter"],
+    "em_freq": [70, "u16", 10, "meter"],
+    "em_grid_power": [71, "s16", 1, "meter"],
+    "em_reactive_power": [72, "s16", 1, "meter"],
+}
+
+# Status/alarm fields read by the watch tier
+SINGLE_PHASE_WATCH_KEYS = (
+    "stop_code",
+    "alarm_code",
+    "status",
+    "battery_status",
+    "battery_bms_alarm",
+    "battery_discharge_limitation_reason",
+    "battery_bms_flags",
+    "battery_bms_warnings",
+    "battery_bms_errors",
+    "battery_bms_faults",
+    "battery_charge_limitation_reason",
+)
+
 BOOLEAN_STATUS = {
     0: "Off",
     1: "On"
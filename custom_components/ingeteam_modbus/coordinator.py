@@ -0,0 +1,131 @@
+"""Domain-wide poll scheduling for Ingeteam Modbus hubs."""
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_at
+
+from .const import DATA_POLL_COORDINATOR, MAX_CONCURRENT_POLLS
+from .polling import next_tick, spread_phases
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_poll_coordinator(hass: HomeAssistant) -> "IngeteamPollCoordinator":
+    """Return the coordinator shared by every hub of this Home Assistant instance."""
+    if DATA_POLL_COORDINATOR not in hass.data:
+        hass.data[DATA_POLL_COORDINATOR] = IngeteamPollCoordinator(hass)
+    return hass.data[DATA_POLL_COORDINATOR]
+
+
+class IngeteamPollCoordinator:
+    """Spread the polls of hubs sharing a scan interval evenly across that interval.
+
+    Hubs with the same interval get phase offsets of interval / n from a fixed
+    anchor, so their reads do not all land in the same event loop tick. When a hub
+    joins or leaves, only the hubs whose phase changes are rescheduled, and they
+    keep polling on their next tick at the new phase instead of polling at once.
+    Registrations in the same loop iteration are rebalanced together. poll_slots
+    caps how many reads are in flight at once across all hubs.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_concurrent: int = MAX_CONCURRENT_POLLS):
+        """Initialize the coordinator."""
+        self._hass = hass
+        # hub -> (phase, cancel), None until the hub's interval group is rebalanced
+        self._schedules = {}
+        # interval -> loop time of phase 0 of that interval group
+        self._anchors = {}
+        # hub -> loop time of the poll made when it registered, until it is scheduled
+        self._registration_polls = {}
+        self._pending_rebalance = set()
+        self.poll_slots = asyncio.Semaphore(max_concurrent)
+
+    @callback
+    def async_register(self, hub, poll_now: bool = True) -> None:
+        """Start polling a hub, rebalancing the phases of its interval group."""
+        self._schedules[hub] = None
+        if poll_now:
+            self._registration_polls[hub] = self._hass.loop.time()
+            self._hass.async_create_task(hub.async_refresh_modbus_data())
+        self._async_request_rebalance(hub.scan_interval)
+
+    @callback
+    def async_unregister(self, hub) -> None:
+        """Stop polling a hub, rebalancing the hubs left in its interval group."""
+        if hub not in self._schedules:
+            return
+        schedule = self._schedules.pop(hub)
+        self._registration_polls.pop(hub, None)
+        if schedule:
+            schedule[1]()
+        self._async_request_rebalance(hub.scan_interval)
+
+    @callback
+    def _async_request_rebalance(self, interval) -> None:
+        if interval not in self._pending_rebalance:
+            self._pending_rebalance.add(interval)
+            self._hass.loop.call_soon(self._async_rebalance, interval)
+
+    @callback
+    def _async_rebalance(self, interval) -> None:
+        self._pending_rebalance.discard(interval)
+        group = [hub for hub in self._schedules if hub.scan_interval == interval]
+        if not group:
+            self._anchors.pop(interval, None)
+            return
+        seconds = interval.total_seconds()
+        now = self._hass.loop.time()
+        anchor = self._anchors.setdefault(interval, now)
+        current = [schedule[0] if schedule else None for schedule in (self._schedules[hub] for hub in group)]
+        moved = 0
+        for hub, phase in zip(group, spread_phases(current, seconds)):
+            if phase is None:
+                continue
+            schedule = self._schedules[hub]
+            if schedule is not None:
+                schedule[1]()
+            first = next_tick(anchor, phase, seconds, now)
+            polled = self._registration_polls.pop(hub, None)
+            if polled is not None and first - polled < seconds / 2:
+                # Too close to the poll made at registration, start at the tick after
+                first += seconds
+            self._schedules[hub] = (phase, self._async_schedule(hub, anchor + phase, seconds, first))
+            moved += 1
+        _LOGGER.debug(
+            "Polling %s hub(s) every %s, %.2fs apart, %s rescheduled",
+            len(group),
+            interval,
+            seconds / len(group),
+            moved,
+        )
+
+    @callback
+    def _async_schedule(self, hub, base: float, seconds: float, first: float):
+        """Poll hub at base + k * seconds (loop time), starting at first.
+
+        Every tick is armed for its exact time rather than one interval after the
+        previous one ran, so loop lag does not accumulate and the phase holds.
+        """
+        unsubs = []
+        when = first
+
+        @callback
+        def _tick(_now=None) -> None:
+            nonlocal when
+            now = self._hass.loop.time()
+            when += seconds
+            if when <= now:
+                # More than an interval behind: skip to the next slot of the phase
+                when = next_tick(base, 0, seconds, now)
+            unsubs[:] = [async_call_at(self._hass, _tick, when)]
+            self._hass.async_create_task(hub.async_refresh_modbus_data())
+
+        unsubs.append(async_call_at(self._hass, _tick, first))
+
+        def _cancel() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return _cancel
@@ -0,0 +1,72 @@
+"""Precomputed decoding tables for Ingeteam enum and bitfield registers."""
+from functools import lru_cache
+
+from .const import (
+    BOOLEAN_STATUS,
+    INVERTER_STATUS,
+    BATTERY_STATUS,
+    BATTERY_BMS_ALARMS,
+    BATTERY_LIMITATION_REASONS,
+    AP_REDUCTION_REASONS,
+)
+
+
+class EnumDecoder:
+    """Map a register code to its label through a dense tuple indexed by code."""
+
+    __slots__ = ("_labels", "_unknown")
+
+    def __init__(self, mapping: dict, unknown: str = "Unknown ({})"):
+        self._unknown = unknown
+        self._labels = tuple(
+            mapping[code] if code in mapping else unknown.format(code) for code in range(max(mapping) + 1)
+        )
+
+    def __call__(self, code: int) -> str:
+        if 0 <= code < len(self._labels):
+            return self._labels[code]
+        return self._unknown.format(code)
+
+
+class BitfieldDecoder:
+    """Expand a bitmask into the labels of its set bits, memoized by raw value."""
+
+    __slots__ = ("_bits", "_expand")
+
+    def __init__(self, mapping: dict, cache_size: int = 256):
+        self._bits = tuple((1 << bit, label) for bit, label in sorted(mapping.items()))
+        self._expand = lru_cache(maxsize=cache_size)(self._labels_for)
+
+    def _labels_for(self, value: int) -> tuple:
+        return tuple(label for mask, label in self._bits if value & mask)
+
+    def __call__(self, value) -> tuple:
+        if not value:
+            return ()
+        return self._expand(value)
+
+
+BOOLEAN_DECODER = EnumDecoder(BOOLEAN_STATUS, unknown="Unknown")
+INVERTER_STATUS_DECODER = EnumDecoder(INVERTER_STATUS)
+BATTERY_STATUS_DECODER = EnumDecoder(BATTERY_STATUS)
+BATTERY_LIMITATION_DECODER = EnumDecoder(BATTERY_LIMITATION_REASONS)
+AP_REDUCTION_DECODER = EnumDecoder(AP_REDUCTION_REASONS)
+BMS_ALARM_DECODER = BitfieldDecoder(BATTERY_BMS_ALARMS)
+
+# Bitfield registers whose active labels are published as "<key>_active"
+BITFIELD_DECODERS = {
+    "battery_bms_alarm": BMS_ALARM_DECODER,
+    "battery_bms_flags": BMS_ALARM_DECODER,
+    "battery_bms_warnings": BMS_ALARM_DECODER,
+    "battery_bms_errors": BMS_ALARM_DECODER,
+    "battery_bms_faults": BMS_ALARM_DECODER,
+}
+
+# Enum decoders by register type name, as used in the register maps
+ENUM_DECODERS = {
+    "boolean": BOOLEAN_DECODER,
+    "inverter_status": INVERTER_STATUS_DECODER,
+    "battery_status": BATTERY_STATUS_DECODER,
+    "battery_limitation": BATTERY_LIMITATION_DECODER,
+    "ap_reduction": AP_REDUCTION_DECODER,
+}
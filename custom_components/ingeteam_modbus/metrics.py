@@ -0,0 +1,115 @@
+"""OpenMetrics scrape endpoint for Ingeteam hub data and poll counters."""
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+
+from .const import DOMAIN, METRICS_URL
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PREFIX = "ingeteam_"
+
+
+def _escape(value) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _add(families: dict, name: str, metric_type: str, labels: str, value, suffix: str = "") -> None:
+    family = families.setdefault(PREFIX + name, (metric_type, []))
+    family[1].append(f"{PREFIX}{name}{suffix}{{{labels}}} {value}")
+
+
+class IngeteamMetricsView(HomeAssistantView):
+    """Render the latest snapshot of every hub with metrics enabled.
+
+    Data samples are rendered once per hub and snapshot, and the full response
+    is reused until a hub publishes a new snapshot or a poll counter changes, so
+    scrapes between polls cost a cache lookup. The caches are keyed on the hub
+    and snapshot objects: a hub recreated by a reload starts its sequence again.
+    """
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    def __init__(self):
+        """Initialize the view."""
+        self._hub_families = {}
+        self._cache_key = None
+        self._cache_body = b""
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics of all hubs."""
+        hass = request.app[KEY_HASS]
+        hubs = [entry["hub"] for entry in hass.data[DOMAIN].values() if entry.get("metrics")]
+        cache_key = tuple(
+            (
+                hub,
+                hub.data,
+                hub.poll_tracker.missed_ticks,
+                hub.poll_tracker.late_polls,
+                hub.poll_tracker.failed_polls,
+            )
+            for hub in hubs
+        )
+        if cache_key != self._cache_key:
+            self._cache_body = self._render(hubs).encode()
+            self._cache_key = cache_key
+        return web.Response(body=self._cache_body, headers={"Content-Type": CONTENT_TYPE})
+
+    def _render(self, hubs) -> str:
+        families = {}
+        for hub in hubs:
+            for name, (metric_type, lines) in self._data_families(hub).items():
+                families.setdefault(name, (metric_type, []))[1].extend(lines)
+            self._add_poll_samples(families, hub)
+        for stale in [hub for hub in self._hub_families if hub not in hubs]:
+            del self._hub_families[stale]
+
+        output = []
+        for name, (metric_type, lines) in families.items():
+            output.append(f"# TYPE {name} {metric_type}")
+            output.extend(lines)
+        output.append("# EOF")
+        return "\n".join(output) + "\n"
+
+    def _data_families(self, hub) -> dict:
+        """Return the data samples of a hub, rendered once per snapshot."""
+        snapshot = hub.data
+        cached = self._hub_families.get(hub)
+        if cached is not None and cached[0] is snapshot:
+            return cached[1]
+
+        hub_label = f'hub="{_escape(hub.name)}"'
+        families = {}
+        for key, value in snapshot.items():
+            if isinstance(value, bool):
+                _add(families, key, "gauge", hub_label, int(value))
+            elif isinstance(value, (int, float)):
+                _add(families, key, "gauge", hub_label, value)
+            elif isinstance(value, str):
+                _add(families, key, "info", f'{hub_label},state="{_escape(value)}"', 1, "_info")
+            elif isinstance(value, tuple):
+                for flag in value:
+                    _add(families, key, "gauge", f'{hub_label},flag="{_escape(flag)}"', 1)
+        for field, count in hub.rejected_samples.items():
+            _add(families, "rejected_samples", "counter", f'{hub_label},field="{field}"', count, "_total")
+        if snapshot.timestamp is not None:
+            _add(families, "snapshot_timestamp_seconds", "gauge", hub_label, snapshot.timestamp)
+        _add(families, "snapshot_sequence", "gauge", hub_label, snapshot.sequence)
+
+        self._hub_families[hub] = (snapshot, families)
+        return families
+
+    @staticmethod
+    def _add_poll_samples(families: dict, hub) -> None:
+        hub_label = f'hub="{_escape(hub.name)}"'
+        tracker = hub.poll_tracker
+        rate = hub.poll_rate
+        if rate is not None:
+            _add(families, "poll_rate", "gauge", hub_label, rate)
+        if tracker.last_poll_duration is not None:
+            _add(families, "poll_duration_seconds", "gauge", hub_label, tracker.last_poll_duration)
+        _add(families, "missed_ticks", "counter", hub_label, tracker.missed_ticks, "_total")
+        _add(families, "late_polls", "counter", hub_label, tracker.late_polls, "_total")
+        _add(families, "failed_polls", "counter", hub_label, tracker.failed_polls, "_total")
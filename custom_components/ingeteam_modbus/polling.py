@@ -0,0 +1,155 @@
+"""Poll bookkeeping: tick accounting, poll rate, domain-wide poll slots and poll phases."""
+import asyncio
+import math
+from collections import deque
+from typing import Optional
+
+from .const import POLL_RATE_WINDOW
+
+
+class PollTracker:
+    """Account for the ticks and polls of one hub.
+
+    The deadline of a poll is the next tick. The first tick that finds a poll
+    still running marks it late, and its result is dropped when it finishes;
+    every further tick it spans is a missed tick. A poll is counted only once.
+    """
+
+    def __init__(self, interval: float, now: float):
+        """Initialize the tracker."""
+        self.interval = interval
+        self.missed_ticks = 0
+        self.late_polls = 0
+        self.failed_polls = 0
+        self.last_poll_duration = None
+        self.in_flight = False
+        self.late = False
+        self._published = deque()
+        self._since = now
+
+    def tick(self) -> bool:
+        """Account for a tick; return True when a new poll may start."""
+        if not self.in_flight:
+            self.in_flight = True
+            self.late = False
+            return True
+        if self.late:
+            self.missed_ticks += 1
+        else:
+            self.late = True
+            self.late_polls += 1
+        return False
+
+    def abandon(self) -> None:
+        """End a poll that never reached the device."""
+        self.in_flight = False
+
+    def finish(self, ok: bool, duration: float, now: float) -> bool:
+        """End a poll; return True when its result is to be published."""
+        self.in_flight = False
+        if self.late:
+            return False
+        self.last_poll_duration = duration
+        if not ok:
+            self.failed_polls += 1
+            return False
+        self._published.append(now)
+        return True
+
+    def set_interval(self, interval: float, now: float) -> None:
+        """Start measuring the rate afresh for a new interval."""
+        self.interval = interval
+        self._published.clear()
+        self._since = now
+
+    def rate(self, now: float) -> Optional[float]:
+        """Return the published polls per second over the last POLL_RATE_WINDOW intervals.
+
+        Polls older than the window are forgotten, so the rate falls to zero while
+        the device stops answering. None until one interval has been measured.
+        """
+        window = self.interval * POLL_RATE_WINDOW
+        published = self._published
+        while published and published[0] <= now - window:
+            published.popleft()
+        span = min(window, now - self._since)
+        if span < self.interval:
+            return None
+        return len(published) / span
+
+
+class SlotLease:
+    """One domain-wide poll slot, taken for a single read until its deadline.
+
+    expire() is called at the deadline: a read that could not start by then
+    never starts, and one still running gives its slot back, so a hub stuck on an
+    unreachable device cannot hold a slot for longer than one interval.
+    """
+
+    __slots__ = ("_slots", "_waiter", "_held", "_expired")
+
+    def __init__(self, slots: asyncio.Semaphore):
+        """Initialize the lease."""
+        self._slots = slots
+        self._waiter = None
+        self._held = False
+        self._expired = False
+
+    async def acquire(self) -> bool:
+        """Wait for a slot; return False if the lease expired first."""
+        if self._expired:
+            return False
+        waiter = self._waiter = asyncio.ensure_future(self._slots.acquire())
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if not self._expired:
+                raise
+            return False
+        finally:
+            self._waiter = None
+        self._held = True
+        if self._expired:
+            self.release()
+            return False
+        return True
+
+    def expire(self) -> None:
+        """Give up the wait for a slot, or give back the slot if held."""
+        self._expired = True
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.cancel()
+        self.release()
+
+    def release(self) -> None:
+        """Return the slot, if held."""
+        if self._held:
+            self._held = False
+            self._slots.release()
+
+
+def spread_phases(current: list, interval: float) -> list:
+    """Return the new phase of each hub of an interval group, None for hubs that keep theirs.
+
+    current holds the phase of each hub, in registration order, or None for hubs
+    not scheduled yet. Hubs get phases interval / n apart; only those whose phase
+    changes are given one.
+    """
+    if not current:
+        return []
+    step = interval / len(current)
+    phases = []
+    for index, phase in enumerate(current):
+        target = index * step
+        if phase is not None and math.isclose(phase, target, abs_tol=1e-6):
+            phases.append(None)
+        else:
+            phases.append(target)
+    return phases
+
+
+def next_tick(anchor: float, phase: float, interval: float, now: float) -> float:
+    """Return the first time after now of the form anchor + phase + k * interval."""
+    base = anchor + phase
+    ticks = math.floor((now - base) / interval) + 1
+    return base + ticks * interval
@@ -0,0 +1,87 @@
+"""One-off probe of an Ingeteam inverter to detect its model profile and populated register blocks."""
+import logging
+
+from pymodbus.client import ModbusTcpClient
+from pymodbus.exceptions import ModbusException
+
+from .const import (
+    CONF_CAPABILITIES,
+    CONF_FIRMWARE,
+    CONF_MODEL,
+    CONF_PROFILE,
+    PROBE_TIMEOUT,
+    PROFILE_AUTO,
+)
+from .profiles import get_profile, resolve_profile
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ProbeError(Exception):
+    """The device could not be reached or did not answer the register read."""
+
+
+class UnknownModelError(ProbeError):
+    """The device identification matched no profile, so one has to be chosen."""
+
+    def __init__(self, model):
+        super().__init__(f"No profile matches model {model!r}")
+        self.model = model
+
+
+def probe_device(
+    host: str, port: int, address: int, profile_id: str = PROFILE_AUTO, fallback_profile: str = None
+) -> dict:
+    """Connect once and return the profile, capabilities, firmware version and model of the device.
+
+    With profile_id "auto" the profile is chosen from the device identification
+    model string. When no profile matches, fallback_profile is used with a warning;
+    without one, UnknownModelError is raised. Raises ProbeError when the input
+    registers cannot be read. Device identification (FC43) is optional; many
+    firmwares do not implement it.
+    """
+    # No retries: firmware that stays silent on FC43 would otherwise cost several timeouts
+    client = ModbusTcpClient(host=host, port=port, timeout=PROBE_TIMEOUT, retries=0)
+    try:
+        if not client.connect():
+            raise ProbeError(f"Could not connect to {host}:{port}")
+
+        firmware = model = None
+        try:
+            identification = client.read_device_information(device_id=address)
+            if not identification.isError():
+                model = _decode_text(identification.information.get(1))
+                firmware = _decode_text(identification.information.get(2))
+        except ModbusException as e:
+            _LOGGER.debug("Device identification not available on %s: %s", host, e)
+
+        profile = resolve_profile(profile_id, model)
+        if profile is None:
+            if fallback_profile is None:
+                raise UnknownModelError(model)
+            profile = get_profile(fallback_profile)
+            _LOGGER.warning(
+                "No profile matches the model %r reported by %s, assuming %s", model, host, profile.name
+            )
+        count = profile.register_count
+        try:
+            response = client.read_input_registers(address=0, count=count, device_id=address)
+        except ModbusException as e:
+            raise ProbeError(str(e)) from e
+        if response.isError() or len(response.registers) < count:
+            raise ProbeError(f"Unexpected response reading input registers: {response}")
+
+        return {
+            CONF_PROFILE: profile.profile_id,
+            CONF_CAPABILITIES: profile.detect_capabilities(response.registers),
+            CONF_FIRMWARE: firmware,
+            CONF_MODEL: model,
+        }
+    finally:
+        client.close()
+
+
+def _decode_text(value):
+    if isinstance(value, bytes):
+        return value.decode("ascii", errors="replace").strip("\x00 ") or None
+    return value
@@ -0,0 +1,214 @@
+"""Inverter model profiles: register maps compiled into decoders, read plans and entity sets."""
+import re
+from typing import Optional
+
+from .const import (
+    CAPABILITY_BATTERY,
+    CAPABILITY_METER,
+    PROFILE_AUTO,
+    READ_MAX_COUNT,
+    READ_PLAN_MAX_GAP,
+    WATCH_PLAN_MAX_GAP,
+    SINGLE_PHASE_REGISTERS,
+    SINGLE_PHASE_WATCH_KEYS,
+    INVERTER_STATUS_TYPES,
+    INVERTER_SENSOR_TYPES,
+    PV_FIELD_SENSOR_TYPES,
+    METER_SENSOR_TYPES,
+    BATTERY_SENSOR_TYPES,
+)
+from .decoding import ENUM_DECODERS, BITFIELD_DECODERS, BATTERY_LIMITATION_DECODER
+
+BATTERY_NOT_CONFIGURED = 7
+
+
+def _signed(value: int) -> int:
+    """Decode a 16-bit signed integer (two's complement)."""
+    if value & 0x8000:
+        return value - 0x10000
+    return value
+
+
+def _compile_field(register_type: str, index: int, scale):
+    """Return a function reading one field from the register list."""
+    if register_type == "u32":
+        # Word order little: low word first, each word big endian
+        return lambda registers: (registers[index + 1] << 16) | registers[index]
+    if register_type in ENUM_DECODERS:
+        decoder = ENUM_DECODERS[register_type]
+        return lambda registers: decoder(registers[index])
+    if register_type == "s16":
+        if scale == 1:
+            return lambda registers: _signed(registers[index])
+        return lambda registers: _signed(registers[index]) / scale
+    if register_type == "u16":
+        if scale == 1:
+            return lambda registers: registers[index]
+        return lambda registers: registers[index] / scale
+    raise ValueError(f"Unknown register type: {register_type}")
+
+
+def _compile_raw(register_type: str, index: int):
+    """Return a function reading the undecoded code of one field."""
+    if register_type == "u32":
+        return lambda registers: (registers[index + 1] << 16) | registers[index]
+    return lambda registers: registers[index]
+
+
+def merge_blocks(blocks, max_gap: int) -> tuple:
+    """Merge (start, count) blocks into as few reads as possible."""
+    plan = []
+    for start, count in sorted(blocks):
+        if plan:
+            plan_start, plan_count = plan[-1]
+            end = max(plan_start + plan_count, start + count)
+            if start - (plan_start + plan_count) <= max_gap and end - plan_start <= READ_MAX_COUNT:
+                plan[-1] = (plan_start, end - plan_start)
+                continue
+        plan.append((start, count))
+    return tuple(plan)
+
+
+class InverterProfile:
+    """Register map of one inverter family, compiled once at import.
+
+    register_map uses the const.py layout, key: [offset, type, scale, group]. Each
+    group compiles to a tuple of (key, reader) pairs and to the register blocks
+    it needs, from which the hub builds its read plan. Watch events are labelled
+    with the decoder of the register type; watch_decoders overrides it for fields
+    that are published raw but still have labelled codes.
+    """
+
+    def __init__(
+        self,
+        profile_id,
+        name,
+        register_map,
+        watch_keys,
+        sensor_types,
+        mppt_count,
+        model_patterns=(),
+        watch_decoders=None,
+    ):
+        """Initialize the profile."""
+        self.profile_id = profile_id
+        self.name = name
+        self.mppt_count = mppt_count
+        self.sensor_types = sensor_types
+        self._model_patterns = tuple(re.compile(pattern, re.IGNORECASE) for pattern in model_patterns)
+
+        self._fields = {}
+        self._raw = {}
+        spans = {}
+        for key, (index, register_type, scale, group) in register_map.items():
+            self._fields.setdefault(group, []).append((key, _compile_field(register_type, index, scale)))
+            self._raw[key] = _compile_raw(register_type, index)
+            spans[key] = (index, 2 if register_type == "u32" else 1)
+        self._fields = {group: tuple(fields) for group, fields in self._fields.items()}
+        self.groups = tuple(self._fields)
+        self.register_count = max(start + count for start, count in spans.values())
+        self._group_blocks = {
+            group: tuple(spans[key] for key, _ in fields) for group, fields in self._fields.items()
+        }
+
+        self.watch_keys = tuple(watch_keys)
+        self.watch_blocks = merge_blocks((spans[key] for key in self.watch_keys), WATCH_PLAN_MAX_GAP)
+        self.watch_decoders = {}
+        for key in self.watch_keys:
+            register_type = register_map[key][1]
+            if key in BITFIELD_DECODERS:
+                self.watch_decoders[key] = BITFIELD_DECODERS[key]
+            elif register_type in ENUM_DECODERS:
+                self.watch_decoders[key] = ENUM_DECODERS[register_type]
+        self.watch_decoders.update(watch_decoders or {})
+
+    def matches(self, model) -> bool:
+        """Return True if the device identification model string belongs to this profile."""
+        return bool(model) and any(pattern.search(model) for pattern in self._model_patterns)
+
+    def read_plan(self, groups) -> tuple:
+        """Return the blocks to read for the given register groups."""
+        return merge_blocks(
+            (block for group in groups if group in self._group_blocks for block in self._group_blocks[group]),
+            READ_PLAN_MAX_GAP,
+        )
+
+    def decode(self, registers, groups) -> dict:
+        """Decode the fields of the given register groups."""
+        data = {}
+        for group in groups:
+            for key, reader in self._fields.get(group, ()):
+                data[key] = reader(registers)
+        return data
+
+    def read_raw(self, registers, keys) -> dict:
+        """Return the undecoded register codes of the given fields."""
+        return {key: self._raw[key](registers) for key in keys}
+
+    def derive(self, data: dict) -> None:
+        """Add the values computed from validated fields."""
+        if "battery_power" in data:
+            data["battery_discharging_power"] = max(0, data["battery_power"])
+            data["battery_charging_power"] = max(0, -data["battery_power"])
+        if "em_grid_power" in data:
+            data["em_active_power"] = max(0, data["em_grid_power"])
+            data["em_active_power_returned"] = max(0, -data["em_grid_power"])
+        data["pv_internal_total_power"] = sum(data.get(f"pv{n}_power", 0) for n in range(1, self.mppt_count + 1))
+        data["pv_total_power"] = data["pv_internal_total_power"] + data.get("external_pv_power", 0)
+        for key, decoder in BITFIELD_DECODERS.items():
+            if key in data:
+                data[f"{key}_active"] = decoder(data[key])
+
+    def detect_capabilities(self, registers) -> dict:
+        """Tell from a full input register read which optional blocks hold data."""
+        raw = self.read_raw(
+            registers,
+            [key for key in ("battery_status", "battery_voltage", "em_voltage", "em_freq") if key in self._raw],
+        )
+        return {
+            # Battery status reports "No Configured" and no voltage without a battery
+            CAPABILITY_BATTERY: raw.get("battery_status", BATTERY_NOT_CONFIGURED) != BATTERY_NOT_CONFIGURED
+            and raw.get("battery_voltage", 0) > 0,
+            # An absent external meter leaves voltage and frequency at zero
+            CAPABILITY_METER: raw.get("em_voltage", 0) > 0 or raw.get("em_freq", 0) > 0,
+        }
+
+
+SINGLE_PHASE = InverterProfile(
+    "1play",
+    "Single-phase hybrid (1Play)",
+    SINGLE_PHASE_REGISTERS,
+    SINGLE_PHASE_WATCH_KEYS,
+    sensor_types={
+        "inverter": (INVERTER_STATUS_TYPES, INVERTER_SENSOR_TYPES, PV_FIELD_SENSOR_TYPES),
+        "meter": (METER_SENSOR_TYPES,),
+        "battery": (BATTERY_SENSOR_TYPES,),
+    },
+    mppt_count=2,
+    model_patterns=(r"1\s*play",),
+    # Published as the raw code, but watch events carry its label
+    watch_decoders={"battery_charge_limitation_reason": BATTERY_LIMITATION_DECODER},
+)
+
+PROFILES = {profile.profile_id: profile for profile in (SINGLE_PHASE,)}
+DEFAULT_PROFILE = SINGLE_PHASE.profile_id
+
+
+def get_profile(profile_id) -> InverterProfile:
+    """Return the profile with this id, falling back to the default one."""
+    return PROFILES.get(profile_id, PROFILES[DEFAULT_PROFILE])
+
+
+def detect_profile(model) -> Optional[InverterProfile]:
+    """Return the profile matching a device identification model string, if any."""
+    for profile in PROFILES.values():
+        if profile.matches(model):
+            return profile
+    return None
+
+
+def resolve_profile(profile_id, model) -> Optional[InverterProfile]:
+    """Return the selected profile, or None when auto-detection finds no match."""
+    if profile_id in (None, PROFILE_AUTO):
+        return detect_profile(model)
+    return get_profile(profile_id)
@@ -3,14 +3,16 @@ from datetime import datetime, UTC, timedelta
 from typing import Optional, Dict, Any
 from decimal import Decimal
 from .const import (
-    INVERTER_STATUS_TYPES,
-    INVERTER_SENSOR_TYPES,
-    METER_SENSOR_TYPES,
-    PV_FIELD_SENSOR_TYPES,
-    BATTERY_SENSOR_TYPES,
+    POLL_SENSOR_TYPES,
     DOMAIN,
     ATTR_MANUFACTURER,
+    CONF_FIRMWARE,
+    CONF_MODEL,
+    ATTR_ACTIVE_FLAGS,
+    ATTR_REJECTED_SAMPLES,
+    SANITY_LIMITS,
 )
+from .decoding import BITFIELD_DECODERS
 from homeassistant.const import (
     CONF_NAME,
     PERCENTAGE,
@@ -38,6 +40,8 @@ from homeassistant.core import callback, CALLBACK_TYPE
 
 _LOGGER = logging.getLogger(__name__)
 
+POLL_COUNTER_KEYS = ("missed_ticks", "late_polls", "failed_polls")
+
 
 async def async_setup_entry(hass, entry, async_add_entities):
     hub_name = entry.data[CONF_NAME]
@@ -47,11 +51,13 @@ async def async_setup_entry(hass, entry, async_add_entities):
         "identifiers": {(DOMAIN, hub_name)},
         "name": hub_name,
         "manufacturer": ATTR_MANUFACTURER,
+        "model": entry.data.get(CONF_MODEL),
+        "sw_version": entry.data.get(CONF_FIRMWARE),
     }
 
     entities = []
-    for sensor_info in INVERTER_STATUS_TYPES.values():
-        sensor = IngeteamSensor(
+    for sensor_info in POLL_SENSOR_TYPES.values():
+        sensor = IngeteamPollSensor(
             hub_name,
             hub,
             device_info,
@@ -61,88 +67,32 @@ async def async_setup_entry(hass, entry, async_add_entities):
             sensor_info[3],
         )
         entities.append(sensor)
-    
-    for sensor_info in INVERTER_SENSOR_TYPES.values():
-        if len(sensor_info) > 4 :
-            sensor = CalculatedEnergySensor(
-                hub,
-                name=f'{hub_name} {sensor_info[0]}', 
-                source_entity=f'sensor.{hub_name}_{sensor_info[4]}',
-                unique_id=f'{hub_name}_{sensor_info[1]}',
-            )
-        else:  
-            sensor = IngeteamSensor(
-                hub_name,
-                hub,
-                device_info,
-                sensor_info[0],
-                sensor_info[1],
-                sensor_info[2],
-                sensor_info[3],
-            )
-        entities.append(sensor)
 
-    for sensor_info in PV_FIELD_SENSOR_TYPES.values():
-        if len(sensor_info) > 4 :
-            sensor = CalculatedEnergySensor(
-                hub,
-                name=f'{hub_name} {sensor_info[0]}', 
-                source_entity=f'sensor.{hub_name}_{sensor_info[4]}',
-                unique_id=f'{hub_name}_{sensor_info[1]}',
-            )
-        else:   
-            sensor = IngeteamSensor(
-                hub_name,
-                hub,
-                device_info,
-                sensor_info[0],
-                sensor_info[1],
-                sensor_info[2],
-                sensor_info[3],
-            )
-        entities.append(sensor)
-
-    if hub.read_meter == True:
-        for sensor_info in METER_SENSOR_TYPES.values():
-            if len(sensor_info) > 4 :
-                sensor = CalculatedEnergySensor(
-                    hub,
-                    name=f'{hub_name} {sensor_info[0]}', 
-                    source_entity=f'sensor.{hub_name}_{sensor_info[4]}',
-                    unique_id=f'{hub_name}_{sensor_info[1]}',
-                )
-            else:    
-                sensor = IngeteamSensor(
-                    hub_name,
-                    hub,
-                    device_info,
-                    sensor_info[0],
-                    sensor_info[1],
-                    sensor_info[2],
-                    sensor_info[3],
-                )
-            entities.append(sensor)
-
-    if hub.read_battery == True:
-        for sensor_info in BATTERY_SENSOR_TYPES.values():
-            if len(sensor_info) > 4 :
-                sensor = CalculatedEnergySensor(
-                    hub,
-                    name=f'{hub_name} {sensor_info[0]}', 
-                    source_entity=f'sensor.{hub_name}_{sensor_info[4]}',
-                    unique_id=f'{hub_name}_{sensor_info[1]}',
-                )
-            else:    
-                sensor = IngeteamSensor(
-                    hub_name,
-                    hub,
-                    device_info,
-                    sensor_info[0],
-                    sensor_info[1],
-                    sensor_info[2],
-                    sensor_info[3],
-                )
-            entities.append(sensor)
+    # The entity set comes from the sensor tables of the hub's model profile
+    enabled_groups = {"inverter": True, "meter": hub.read_meter, "battery": hub.read_battery}
+    for group, sensor_tables in hub.profile.sensor_types.items():
+        if not enabled_groups.get(group, True):
+            continue
+        for sensor_types in sensor_tables:
+            for sensor_info in sensor_types.values():
+                if len(sensor_info) > 4 :
+                    sensor = CalculatedEnergySensor(
+                        hub,
+                        name=f'{hub_name} {sensor_info[0]}', 
+                        source_entity=f'sensor.{hub_name}_{sensor_info[4]}',
+                        unique_id=f'{hub_name}_{sensor_info[1]}',
+                    )
+                else:
+                    sensor = IngeteamSensor(
+                        hub_name,
+                        hub,
+                        device_info,
+                        sensor_info[0],
+                        sensor_info[1],
+                        sensor_info[2],
+                        sensor_info[3],
+                    )
+                entities.append(sensor)
 
     async_add_entities(entities)
     return True
@@ -261,6 +211,7 @@ class IngeteamSensor(SensorEntity):
         self._device_info = device_info
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self.entity_description = _DESCRIPTIONS.get(unit, DIAG_SENSOR)
+        self._active_key = f"{key}_active" if key in BITFIELD_DECODERS else None
 
     async def async_added_to_hass(self):
         """Register callbacks."""
@@ -300,8 +251,17 @@ class IngeteamSensor(SensorEntity):
     @property
     def state(self):
         """Return the state of the sensor."""
-        if self._key in self._hub.data:
-            return self._hub.data[self._key]
+        return self._hub.data.get(self._key)
+
+    @property
+    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
+        """Return the decoded flags of bitfield registers and the rejected sample count."""
+        attributes = {}
+        if self._active_key is not None:
+            attributes[ATTR_ACTIVE_FLAGS] = list(self._hub.data.get(self._active_key, ()))
+        if self._key in SANITY_LIMITS:
+            attributes[ATTR_REJECTED_SAMPLES] = self._hub.rejected_samples[self._key]
+        return attributes or None
 
     @property
     def should_poll(self) -> bool:
@@ -311,3 +271,29 @@ class IngeteamSensor(SensorEntity):
     @property
     def device_info(self) -> Optional[Dict[str, Any]]:
         return self._device_info
+
+
+class IngeteamPollSensor(IngeteamSensor):
+    """Representation of a poll scheduling counter of an Ingeteam hub.
+
+    Updated on every tick outcome, so the counters keep moving while the device
+    does not answer.
+    """
+
+    def __init__(self, platform_name, hub, device_info, name, key, unit, icon):
+        """Initialize the sensor."""
+        super().__init__(platform_name, hub, device_info, name, key, unit, icon)
+        if key in POLL_COUNTER_KEYS:
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    async def async_added_to_hass(self):
+        """Register callbacks."""
+        self._hub.async_add_poll_listener(self._modbus_data_updated)
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._hub.async_remove_poll_listener(self._modbus_data_updated)
+
+    @property
+    def state(self):
+        """Return the state of the sensor."""
+        return self._hub.poll_stats.get(self._key)
@@ -0,0 +1,63 @@
+"""Immutable snapshots of the decoded data of one hub."""
+_MISSING = object()
+
+
+class IngeteamSnapshot:
+    """Decoded values of one poll, published by swapping a single reference.
+
+    Values live in a tuple indexed through a layout dict shared by every snapshot
+    of the hub. The layout is append-only, so a field added by a later poll never
+    moves the index of an existing one and older snapshots stay valid.
+    """
+
+    __slots__ = ("_layout", "_values", "timestamp", "sequence")
+
+    def __init__(self, layout: dict, values: tuple = (), timestamp: float = None, sequence: int = 0):
+        """Initialize the snapshot."""
+        self._layout = layout
+        self._values = values
+        self.timestamp = timestamp
+        self.sequence = sequence
+
+    def evolve(self, data: dict, timestamp: float) -> "IngeteamSnapshot":
+        """Return the next snapshot, holding exactly these values.
+
+        Fields missing from data (e.g. a register group that was disabled) are
+        absent from the new snapshot.
+        """
+        layout = self._layout
+        for key in data:
+            if key not in layout:
+                layout[key] = len(layout)
+        values = [_MISSING] * len(layout)
+        for key, value in data.items():
+            values[layout[key]] = value
+        return IngeteamSnapshot(layout, tuple(values), timestamp, self.sequence + 1)
+
+    def get(self, key: str, default=None):
+        """Return the value of key, or default when this snapshot has none."""
+        index = self._layout.get(key)
+        if index is None or index >= len(self._values):
+            return default
+        value = self._values[index]
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key: str):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def items(self):
+        """Iterate over (key, value) pairs present in this snapshot."""
+        values = self._values
+        for key, index in list(self._layout.items()):
+            if index < len(values) and values[index] is not _MISSING:
+                yield key, values[index]
+
+    def as_dict(self) -> dict:
+        """Return the values as a plain dict."""
+        return dict(self.items())
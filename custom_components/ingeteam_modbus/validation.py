@@ -0,0 +1,72 @@
+"""Sanity filtering of decoded values before they are published."""
+from collections import deque
+from statistics import median
+
+from .const import SANITY_CONFIRM_SAMPLES
+
+
+class FieldLimit:
+    """Validation rules for one decoded field."""
+
+    __slots__ = ("minimum", "maximum", "max_step", "window")
+
+    def __init__(self, minimum, maximum, max_step=None, median_window=0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.max_step = max_step
+        self.window = deque(maxlen=median_window) if median_window > 1 else None
+
+
+class SampleValidator:
+    """Reject out-of-range values and single-poll spikes, holding the last good value.
+
+    A step larger than max_step is only accepted once it has been seen for
+    SANITY_CONFIRM_SAMPLES consecutive polls, so real changes get through with a
+    short delay while one-off glitches are dropped. Out-of-range values are never
+    accepted. Fields with a median window are withheld until the window is full,
+    so a glitch right after start-up is filtered like any other.
+    """
+
+    def __init__(self, limits: dict):
+        self._limits = tuple((key, FieldLimit(*spec)) for key, spec in limits.items())
+        self._last_good = {}
+        self._step_streak = {}
+        self.rejected = dict.fromkeys(limits, 0)
+
+    @property
+    def rejected_total(self) -> int:
+        """Return the number of samples rejected across all fields."""
+        return sum(self.rejected.values())
+
+    def apply(self, data: dict) -> None:
+        """Validate data in place, replacing rejected values by the last good one."""
+        for key, limit in self._limits:
+            value = data.get(key)
+            if value is None:
+                continue
+            last = self._last_good.get(key)
+            if not limit.minimum <= value <= limit.maximum:
+                self._reject(data, key, last)
+                continue
+            if limit.max_step is not None and last is not None and abs(value - last) > limit.max_step:
+                streak = self._step_streak.get(key, 0) + 1
+                if streak < SANITY_CONFIRM_SAMPLES:
+                    self._step_streak[key] = streak
+                    self._reject(data, key, last)
+                    continue
+            self._step_streak.pop(key, None)
+            if limit.window is not None:
+                limit.window.append(value)
+                if len(limit.window) < limit.window.maxlen:
+                    del data[key]
+                    continue
+                value = median(limit.window)
+                data[key] = value
+            self._last_good[key] = value
+
+    def _reject(self, data: dict, key: str, last) -> None:
+        self.rejected[key] += 1
+        if last is None:
+            del data[key]
+        else:
+            data[key] = last
@@ -0,0 +1,85 @@
+"""Coalescing of holding register writes into verified FC16 batches."""
+import asyncio
+
+from .const import WRITE_COALESCE_DELAY, WRITE_MAX_BATCH
+
+
+def build_batches(registers: dict, max_batch: int = WRITE_MAX_BATCH) -> list:
+    """Group address->value pairs into (start, [values]) runs of contiguous addresses."""
+    batches = []
+    for address in sorted(registers):
+        if (
+            batches
+            and address == batches[-1][0] + len(batches[-1][1])
+            and len(batches[-1][1]) < max_batch
+        ):
+            batches[-1][1].append(registers[address])
+        else:
+            batches.append((address, [registers[address]]))
+    return batches
+
+
+class WriteCoalescer:
+    """Merge writes arriving within a short delay and send them one flush at a time.
+
+    send is a coroutine function taking the batches and returning the read-back
+    value by address. Every caller is answered for its own values: a write
+    overtaken by a later one to the same register, or a failed register written
+    by someone else, only fails the callers it concerns. Writes queued while a
+    flush is on the wire wait for the next one, so a newer value can never be
+    overtaken by an older one.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, send, delay: float = WRITE_COALESCE_DELAY):
+        """Initialize the coalescer."""
+        self._loop = loop
+        self._send = send
+        self._delay = delay
+        self._pending = {}
+        self._waiters = []
+        self._timer = None
+        self._in_flight = False
+
+    async def write(self, address: int, values) -> bool:
+        """Queue values from address on and return whether they were read back as written."""
+        own = {address + offset: value & 0xFFFF for offset, value in enumerate(values)}
+        self._pending.update(own)
+        waiter = self._loop.create_future()
+        self._waiters.append((waiter, own))
+        self._schedule()
+        return await waiter
+
+    def cancel(self) -> None:
+        """Drop pending writes, releasing anyone waiting on them."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = {}
+        waiters, self._waiters = self._waiters, []
+        for waiter, _ in waiters:
+            if not waiter.done():
+                waiter.set_result(False)
+
+    def _schedule(self) -> None:
+        """Schedule a flush unless one is already scheduled or running."""
+        if self._timer is None and not self._in_flight:
+            self._timer = self._loop.call_later(self._delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._timer = None
+        self._in_flight = True
+        self._loop.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        waiters, self._waiters = self._waiters, []
+        readback = {}
+        try:
+            readback = await self._send(build_batches(pending))
+        finally:
+            self._in_flight = False
+            for waiter, own in waiters:
+                if not waiter.done():
+                    waiter.set_result(all(readback.get(address) == value for address, value in own.items()))
+            if self._pending:
+                self._schedule()
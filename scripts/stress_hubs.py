@@ -0,0 +1,255 @@
+"""Multi-hub polling stress test for the Ingeteam Modbus integration.
+
+Starts N simulated inverters (pymodbus TCP servers on localhost) and N
+IngeteamModbusHub instances polling them, then reports for each N:
+
+- achieved poll rate, missed ticks, and ticks skipped or dropped by the hub scheduler
+- executor queue depth
+- event loop lag
+- memory allocated per hub
+
+The simulators run in a child process, so their CPU time and allocations are not
+counted against the hubs, and the event loop uses an executor of the size Home
+Assistant installs.
+
+Needs homeassistant and pymodbus installed. Run from the repository root:
+
+    python scripts/stress_hubs.py --hubs 1,10,50,100,200 --scan-interval 1 --duration 30
+
+--max-concurrent takes a list too, to compare domain-wide read caps.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.runner import MAX_EXECUTOR_WORKERS  # noqa: E402
+from homeassistant.util.executor import InterruptibleThreadPoolExecutor  # noqa: E402
+from pymodbus.datastore import (  # noqa: E402
+    ModbusDeviceContext,
+    ModbusSequentialDataBlock,
+    ModbusServerContext,
+)
+from pymodbus.server import ModbusTcpServer  # noqa: E402
+
+from custom_components.ingeteam_modbus import IngeteamModbusHub  # noqa: E402
+from custom_components.ingeteam_modbus.const import DATA_POLL_COORDINATOR, MAX_CONCURRENT_POLLS  # noqa: E402
+from custom_components.ingeteam_modbus.coordinator import IngeteamPollCoordinator  # noqa: E402
+
+# Input registers 0-80 of a running inverter with battery and external meter
+SIMULATED_REGISTERS = [0] * 81
+SIMULATED_REGISTERS[6:8] = [1200, 0]  # total operation time
+SIMULATED_REGISTERS[15] = 3  # On-grid
+SIMULATED_REGISTERS[17:22] = [512, 150, 800, 64, 98]  # battery V, I, P, SOC, SOH
+SIMULATED_REGISTERS[26:28] = [1, 215]  # battery status, temp
+SIMULATED_REGISTERS[30:37] = [511, 350, 420, 1470, 340, 410, 1394]  # battery V int, PV1, PV2
+SIMULATED_REGISTERS[37:40] = [2300, 0, 1000]  # active power, reactive, cos phi
+SIMULATED_REGISTERS[43:54] = [231, 450, 5000, 1040, 0, 231, 1000, 5000, 2300, 0, 1000]
+SIMULATED_REGISTERS[54:58] = [380, 412, 405, 388]  # DC bus, temperatures
+SIMULATED_REGISTERS[69:73] = [231, 500, 0xFE0C, 0]  # external meter, exporting 500 W
+SIMULATED_REGISTERS[78] = 1040  # total loads power
+
+# Modes offered by the integration: full poll only, or full poll plus status/alarm watch tier
+MODES = {
+    "full": {"watch_interval": 0},
+    "full+watch": {"watch_interval": 1},
+}
+
+LAG_SAMPLE_INTERVAL = 0.05
+QUEUE_SAMPLE_INTERVAL = 0.1
+SIMULATOR_START_TIMEOUT = 60
+
+
+async def start_simulators(count: int, base_port: int) -> list:
+    """Start count simulated inverters on consecutive ports."""
+    servers = []
+    for index in range(count):
+        device = ModbusDeviceContext(
+            ir=ModbusSequentialDataBlock(1, list(SIMULATED_REGISTERS)),
+            hr=ModbusSequentialDataBlock(1, [0] * 100),
+        )
+        server = ModbusTcpServer(
+            ModbusServerContext(devices=device, single=True), address=("127.0.0.1", base_port + index)
+        )
+        await server.serve_forever(background=True)
+        servers.append(server)
+    return servers
+
+
+def serve_simulators(count: int, base_port: int, ready) -> None:
+    """Run count simulated inverters until terminated. Runs in a child process."""
+
+    async def serve():
+        await start_simulators(count, base_port)
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+async def sample_loop_lag(samples: list, stop: asyncio.Event) -> None:
+    """Record how late the loop wakes up from a short sleep."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(LAG_SAMPLE_INTERVAL)
+        samples.append(loop.time() - start - LAG_SAMPLE_INTERVAL)
+
+
+async def sample_queue_depth(samples: list, stop: asyncio.Event) -> None:
+    """Record the number of jobs waiting in the default executor."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        executor = getattr(loop, "_default_executor", None)
+        if executor is not None:
+            samples.append(executor._work_queue.qsize())
+        await asyncio.sleep(QUEUE_SAMPLE_INTERVAL)
+
+
+async def run_step(hass, count: int, mode: str, max_concurrent: int, args) -> dict:
+    """Poll count simulated inverters for args.duration seconds."""
+    context = multiprocessing.get_context("spawn")
+    ready = context.Event()
+    simulators = context.Process(target=serve_simulators, args=(count, args.base_port, ready), daemon=True)
+    simulators.start()
+    if not await asyncio.to_thread(ready.wait, SIMULATOR_START_TIMEOUT):
+        simulators.terminate()
+        raise RuntimeError(f"{count} simulators did not start within {SIMULATOR_START_TIMEOUT}s")
+    hass.data[DATA_POLL_COORDINATOR] = IngeteamPollCoordinator(hass, max_concurrent)
+    polls = [0] * count
+
+    def counter(index):
+        def _updated():
+            polls[index] += 1
+
+        return _updated
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    hubs = []
+    callbacks = []
+    for index in range(count):
+        hub = IngeteamModbusHub(
+            hass,
+            f"stress_{index}",
+            "127.0.0.1",
+            args.base_port + index,
+            1,
+            args.scan_interval,
+            read_meter=True,
+            read_battery=True,
+            **MODES[mode],
+        )
+        update_callback = counter(index)
+        hub.async_add_ingeteam_sensor(update_callback)
+        hubs.append(hub)
+        callbacks.append(update_callback)
+
+    # One interval to settle, then measure memory with every hub holding data
+    await asyncio.sleep(args.scan_interval * 1.5)
+    memory_per_hub = (tracemalloc.get_traced_memory()[0] - before) / count
+    tracemalloc.stop()
+
+    polls[:] = [0] * count
+    for hub in hubs:
+        hub.poll_tracker.missed_ticks = hub.poll_tracker.late_polls = 0
+    lag_samples, queue_samples = [], []
+    stop = asyncio.Event()
+    samplers = [
+        asyncio.create_task(sample_loop_lag(lag_samples, stop)),
+        asyncio.create_task(sample_queue_depth(queue_samples, stop)),
+    ]
+    started = time.monotonic()
+    await asyncio.sleep(args.duration)
+    elapsed = time.monotonic() - started
+    stop.set()
+    await asyncio.gather(*samplers)
+
+    for hub, update_callback in zip(hubs, callbacks):
+        hub.async_remove_ingeteam_sensor(update_callback)
+    simulators.terminate()
+    await asyncio.to_thread(simulators.join)
+
+    expected = elapsed / args.scan_interval
+    lag_samples.sort()
+    return {
+        "hubs": count,
+        "mode": mode,
+        "slots": max_concurrent,
+        "rate": sum(polls) / elapsed / count,
+        "target": 1 / args.scan_interval,
+        "missed": sum(max(0, round(expected) - done) for done in polls),
+        "skipped": sum(hub.poll_tracker.missed_ticks for hub in hubs),
+        "late": sum(hub.poll_tracker.late_polls for hub in hubs),
+        "queue_max": max(queue_samples, default=0),
+        "queue_mean": statistics.fmean(queue_samples) if queue_samples else 0.0,
+        "lag_p50": lag_samples[len(lag_samples) // 2] * 1000 if lag_samples else 0.0,
+        "lag_p99": lag_samples[int(len(lag_samples) * 0.99)] * 1000 if lag_samples else 0.0,
+        "lag_max": lag_samples[-1] * 1000 if lag_samples else 0.0,
+        "memory_kib": memory_per_hub / 1024,
+    }
+
+
+def print_report(results: list) -> None:
+    """Print one line per step."""
+    header = (
+        f"{'mode':<11} {'slots':>5} {'hubs':>5} {'rate/s':>8} {'target':>7} {'missed':>7} {'skipped':>7} {'late':>5} "
+        f"{'queue max':>9} {'queue avg':>9} {'lag p50':>8} {'lag p99':>8} {'lag max':>8} {'KiB/hub':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['mode']:<11} {r['slots']:>5} {r['hubs']:>5} {r['rate']:>8.2f} {r['target']:>7.2f} {r['missed']:>7} "
+            f"{r['skipped']:>7} {r['late']:>5} "
+            f"{r['queue_max']:>9} {r['queue_mean']:>9.1f} {r['lag_p50']:>6.1f}ms {r['lag_p99']:>6.1f}ms "
+            f"{r['lag_max']:>6.1f}ms {r['memory_kib']:>8.1f}"
+        )
+
+
+async def main(args) -> None:
+    # Home Assistant replaces asyncio's default executor with one of its own size
+    executor = InterruptibleThreadPoolExecutor(thread_name_prefix="SyncWorker", max_workers=MAX_EXECUTOR_WORKERS)
+    asyncio.get_running_loop().set_default_executor(executor)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        results = []
+        for mode in args.modes:
+            for max_concurrent in args.max_concurrent:
+                for count in args.hubs:
+                    result = await run_step(hass, count, mode, max_concurrent, args)
+                    results.append(result)
+                    if args.verbose:
+                        print_report([result])
+        print_report(results)
+    executor.shutdown(wait=False)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hubs", default="1,10,50,100,200", type=lambda v: [int(n) for n in v.split(",")])
+    parser.add_argument("--modes", default=",".join(MODES), type=lambda v: v.split(","))
+    parser.add_argument(
+        "--max-concurrent", default=str(MAX_CONCURRENT_POLLS), type=lambda v: [int(n) for n in v.split(",")]
+    )
+    parser.add_argument("--scan-interval", default=1, type=int)
+    parser.add_argument("--duration", default=30, type=float, help="seconds measured per step")
+    parser.add_argument("--base-port", default=15020, type=int)
+    parser.add_argument("--verbose", action="store_true", help="print each step as it finishes")
+    args = parser.parse_args()
+    unknown = set(args.modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(sorted(unknown))}")
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
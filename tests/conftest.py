@@ -0,0 +1,20 @@
+"""Make the integration's pure-Python modules importable without Home Assistant.
+
+The package __init__ sets up the Home Assistant integration, so it is replaced by
+a bare package object; submodules such as validation or profiles only depend on
+const.py and import normally through it.
+"""
+import sys
+import types
+from pathlib import Path
+
+PACKAGE = "custom_components.ingeteam_modbus"
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "ingeteam_modbus"
+
+if PACKAGE not in sys.modules:
+    parent = types.ModuleType("custom_components")
+    parent.__path__ = [str(PACKAGE_DIR.parent)]
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules.setdefault("custom_components", parent)
+    sys.modules[PACKAGE] = package
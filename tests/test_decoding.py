@@ -0,0 +1,24 @@
+"""Tests for the enum and bitfield decoders."""
+from custom_components.ingeteam_modbus.decoding import BitfieldDecoder, EnumDecoder
+
+
+def test_enum_decoder_labels_known_and_unknown_codes():
+    decoder = EnumDecoder({0: "Off", 2: "On"})
+    assert decoder(0) == "Off"
+    assert decoder(2) == "On"
+    assert decoder(1) == "Unknown (1)"
+    assert decoder(9) == "Unknown (9)"
+    assert decoder(-1) == "Unknown (-1)"
+
+
+def test_enum_decoder_custom_unknown_label():
+    decoder = EnumDecoder({0: "No", 1: "Yes"}, unknown="Unknown")
+    assert decoder(5) == "Unknown"
+
+
+def test_bitfield_decoder_lists_set_bits_in_bit_order():
+    decoder = BitfieldDecoder({0: "A", 3: "D", 1: "B"})
+    assert decoder(0) == ()
+    assert decoder(None) == ()
+    assert decoder(0b1011) == ("A", "B", "D")
+    assert decoder(0b0100) == ()
@@ -0,0 +1,77 @@
+"""Tests for the tick accounting and poll slots of a hub."""
+import asyncio
+
+from custom_components.ingeteam_modbus.const import POLL_RATE_WINDOW
+from custom_components.ingeteam_modbus.polling import PollTracker, SlotLease
+
+
+def test_poll_finishing_before_the_next_tick_is_published():
+    tracker = PollTracker(1, now=0)
+    assert tracker.tick()
+    assert tracker.finish(True, 0.2, now=0.2)
+    assert tracker.tick()
+    assert (tracker.missed_ticks, tracker.late_polls, tracker.failed_polls) == (0, 0, 0)
+    assert tracker.last_poll_duration == 0.2
+
+
+def test_late_poll_is_counted_once_and_dropped():
+    tracker = PollTracker(1, now=0)
+    assert tracker.tick()
+    assert not tracker.tick()
+    assert not tracker.finish(True, 1.5, now=1.5)
+    assert (tracker.missed_ticks, tracker.late_polls) == (0, 1)
+    assert tracker.tick()
+
+
+def test_further_ticks_spanned_by_a_late_poll_are_missed():
+    tracker = PollTracker(1, now=0)
+    tracker.tick()
+    tracker.tick()
+    tracker.tick()
+    tracker.tick()
+    assert not tracker.finish(False, 3.5, now=3.5)
+    assert (tracker.missed_ticks, tracker.late_polls, tracker.failed_polls) == (2, 1, 0)
+
+
+def test_failed_poll_is_counted_but_not_published():
+    tracker = PollTracker(1, now=0)
+    tracker.tick()
+    assert not tracker.finish(False, 0.5, now=0.5)
+    assert tracker.failed_polls == 1
+    assert tracker.rate(now=1) == 0
+
+
+def test_abandoned_poll_frees_the_next_tick():
+    tracker = PollTracker(1, now=0)
+    tracker.tick()
+    tracker.tick()
+    tracker.abandon()
+    assert tracker.tick()
+    assert tracker.late_polls == 1
+
+
+def test_rate_decays_when_polls_stop():
+    tracker = PollTracker(1, now=0)
+    assert tracker.rate(now=0.5) is None
+    for second in range(10):
+        tracker.tick()
+        tracker.finish(True, 0.1, now=second + 0.1)
+    assert tracker.rate(now=10) == 1
+    assert tracker.rate(now=10 + POLL_RATE_WINDOW / 2) < 1
+    assert tracker.rate(now=10 + POLL_RATE_WINDOW) == 0
+
+
+def test_expired_lease_gives_up_waiting_for_a_slot():
+    async def scenario():
+        slots = asyncio.Semaphore(1)
+        holder = SlotLease(slots)
+        assert await holder.acquire()
+        waiting = SlotLease(slots)
+        pending = asyncio.ensure_future(waiting.acquire())
+        await asyncio.sleep(0)
+        waiting.expire()
+        result = await pending
+        holder.release()
+        return result, slots.locked()
+
+    assert asyncio.run(scenario()) == (False, False)
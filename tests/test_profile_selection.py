@@ -0,0 +1,23 @@
+"""Tests for the selection of the inverter model profile."""
+from custom_components.ingeteam_modbus.const import PROFILE_AUTO
+from custom_components.ingeteam_modbus.profiles import SINGLE_PHASE, resolve_profile
+
+
+def test_auto_detects_the_profile_from_the_model():
+    assert resolve_profile(PROFILE_AUTO, "INGECON SUN STORAGE 1Play 6TL M") is SINGLE_PHASE
+    assert resolve_profile(PROFILE_AUTO, "INGECON SUN 1 Play 3.3TL") is SINGLE_PHASE
+
+
+def test_unknown_model_is_not_given_a_profile():
+    assert resolve_profile(PROFILE_AUTO, "INGECON SUN 3Play 10TL M") is None
+    assert resolve_profile(PROFILE_AUTO, "INGECON SUN STORAGE 100TL") is None
+    assert resolve_profile(PROFILE_AUTO, None) is None
+
+
+def test_explicit_profile_ignores_the_model():
+    assert resolve_profile(SINGLE_PHASE.profile_id, None) is SINGLE_PHASE
+
+
+def test_watch_decoders_label_raw_published_fields():
+    decoder = SINGLE_PHASE.watch_decoders["battery_charge_limitation_reason"]
+    assert decoder(0) == "No limitation"
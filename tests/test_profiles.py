@@ -0,0 +1,50 @@
+"""Tests for the read plan merging and capability detection."""
+from custom_components.ingeteam_modbus.const import (
+    CAPABILITY_BATTERY,
+    CAPABILITY_METER,
+    READ_MAX_COUNT,
+    SINGLE_PHASE_REGISTERS,
+)
+from custom_components.ingeteam_modbus.profiles import SINGLE_PHASE, merge_blocks
+
+
+def test_merges_blocks_within_the_gap():
+    assert merge_blocks([(10, 2), (0, 4), (6, 1)], max_gap=3) == ((0, 12),)
+
+
+def test_keeps_blocks_further_apart_than_the_gap():
+    assert merge_blocks([(0, 2), (10, 2)], max_gap=7) == ((0, 2), (10, 2))
+
+
+def test_overlapping_blocks_are_merged():
+    assert merge_blocks([(0, 10), (2, 3)], max_gap=0) == ((0, 10),)
+
+
+def test_never_exceeds_the_read_size():
+    blocks = [(start, 1) for start in range(0, READ_MAX_COUNT + 10)]
+    plan = merge_blocks(blocks, max_gap=0)
+    assert plan == ((0, READ_MAX_COUNT), (READ_MAX_COUNT, 10))
+
+
+def registers_with(**values):
+    registers = [0] * SINGLE_PHASE.register_count
+    for key, value in values.items():
+        registers[SINGLE_PHASE_REGISTERS[key][0]] = value
+    return registers
+
+
+def test_detects_nothing_on_empty_blocks():
+    capabilities = SINGLE_PHASE.detect_capabilities(registers_with())
+    assert capabilities == {CAPABILITY_BATTERY: False, CAPABILITY_METER: False}
+
+
+def test_detects_battery_and_meter():
+    capabilities = SINGLE_PHASE.detect_capabilities(
+        registers_with(battery_status=1, battery_voltage=512, em_voltage=231)
+    )
+    assert capabilities == {CAPABILITY_BATTERY: True, CAPABILITY_METER: True}
+
+
+def test_unconfigured_battery_is_not_detected():
+    capabilities = SINGLE_PHASE.detect_capabilities(registers_with(battery_status=7, battery_voltage=512))
+    assert not capabilities[CAPABILITY_BATTERY]
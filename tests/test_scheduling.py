@@ -0,0 +1,40 @@
+"""Tests for the poll phase maths and the release of poll slots at the deadline."""
+import asyncio
+
+from custom_components.ingeteam_modbus.polling import SlotLease, next_tick, spread_phases
+
+
+def test_new_group_is_spread_evenly():
+    assert spread_phases([None, None, None, None], 8) == [0, 2, 4, 6]
+
+
+def test_joining_hub_only_moves_hubs_whose_phase_changes():
+    assert spread_phases([0, 6, None], 12) == [None, 4, 8]
+    assert spread_phases([0, 4, 8], 12) == [None, None, None]
+
+
+def test_leaving_hub_keeps_the_first_phase():
+    assert spread_phases([0, 8], 12) == [None, 6]
+    assert spread_phases([], 12) == []
+
+
+def test_next_tick_follows_the_anchor_not_the_last_run():
+    assert next_tick(100, 2, 10, now=100) == 102
+    assert next_tick(100, 2, 10, now=102) == 112
+    assert next_tick(100, 2, 10, now=157.9) == 162
+    assert next_tick(100, 2, 10, now=95) == 102
+
+
+def test_expired_lease_gives_back_a_held_slot():
+    async def scenario():
+        slots = asyncio.Semaphore(1)
+        stuck = SlotLease(slots)
+        assert await stuck.acquire()
+        stuck.expire()
+        healthy = SlotLease(slots)
+        acquired = await asyncio.wait_for(healthy.acquire(), 1)
+        stuck.release()
+        healthy.release()
+        return acquired, slots.locked()
+
+    assert asyncio.run(scenario()) == (True, False)
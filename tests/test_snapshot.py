@@ -0,0 +1,25 @@
+"""Tests for the immutable hub snapshots."""
+from custom_components.ingeteam_modbus.snapshot import IngeteamSnapshot
+
+
+def test_evolve_builds_a_new_snapshot():
+    first = IngeteamSnapshot({}).evolve({"a": 1, "b": None}, 10.0)
+    second = first.evolve({"a": 2, "c": 3}, 20.0)
+    assert first.as_dict() == {"a": 1, "b": None}
+    assert second.as_dict() == {"a": 2, "c": 3}
+    assert (first.sequence, second.sequence) == (1, 2)
+    assert second.timestamp == 20.0
+
+
+def test_missing_keys_are_absent():
+    snapshot = IngeteamSnapshot({}).evolve({"a": 1, "b": 2}, 0).evolve({"a": 1}, 0)
+    assert "b" not in snapshot
+    assert snapshot.get("b", "default") == "default"
+    assert snapshot["a"] == 1
+
+
+def test_older_snapshot_survives_layout_growth():
+    first = IngeteamSnapshot({}).evolve({"a": 1}, 0)
+    first.evolve({"z": 9, "a": 2}, 0)
+    assert first.as_dict() == {"a": 1}
+    assert "z" not in first
@@ -0,0 +1,65 @@
+"""Tests for the sanity validator."""
+from custom_components.ingeteam_modbus.const import SANITY_CONFIRM_SAMPLES
+from custom_components.ingeteam_modbus.validation import SampleValidator
+
+
+def run(validator, key, values):
+    """Feed one value per poll and return what would be published."""
+    published = []
+    for value in values:
+        data = {key: value}
+        validator.apply(data)
+        published.append(data.get(key))
+    return published
+
+
+def test_out_of_range_holds_last_good_value():
+    validator = SampleValidator({"soc": [0, 100, None, 0]})
+    assert run(validator, "soc", [50, 250, 60]) == [50, 50, 60]
+    assert validator.rejected == {"soc": 1}
+
+
+def test_out_of_range_without_good_value_is_dropped():
+    validator = SampleValidator({"soc": [0, 100, None, 0]})
+    data = {"soc": -1, "other": 7}
+    validator.apply(data)
+    assert data == {"other": 7}
+    assert validator.rejected_total == 1
+
+
+def test_out_of_range_is_never_confirmed():
+    validator = SampleValidator({"soc": [0, 100, None, 0]})
+    assert run(validator, "soc", [50] + [250] * (SANITY_CONFIRM_SAMPLES + 2)) == [50] * (SANITY_CONFIRM_SAMPLES + 3)
+
+
+def test_single_spike_is_rejected():
+    validator = SampleValidator({"soc": [0, 100, 20, 0]})
+    assert run(validator, "soc", [50, 95, 52]) == [50, 50, 52]
+    assert validator.rejected["soc"] == 1
+
+
+def test_step_is_accepted_after_confirmation():
+    validator = SampleValidator({"soc": [0, 100, 20, 0]})
+    published = run(validator, "soc", [50] + [95] * SANITY_CONFIRM_SAMPLES)
+    assert published == [50] * SANITY_CONFIRM_SAMPLES + [95]
+    assert validator.rejected["soc"] == SANITY_CONFIRM_SAMPLES - 1
+
+
+def test_confirmation_restarts_after_an_accepted_value():
+    validator = SampleValidator({"soc": [0, 100, 20, 0]})
+    values = [50] + [95] * (SANITY_CONFIRM_SAMPLES - 1) + [51] + [95] * (SANITY_CONFIRM_SAMPLES - 1)
+    assert run(validator, "soc", values) == [50] * SANITY_CONFIRM_SAMPLES + [51] * SANITY_CONFIRM_SAMPLES
+
+
+def test_median_field_is_withheld_until_window_is_full():
+    validator = SampleValidator({"power": [-1000, 1000, None, 3]})
+    assert run(validator, "power", [100, -900, 110, 120]) == [None, None, 100, 110]
+    assert validator.rejected_total == 0
+
+
+def test_missing_fields_are_ignored():
+    validator = SampleValidator({"soc": [0, 100, None, 0]})
+    data = {}
+    validator.apply(data)
+    assert data == {}
+    assert validator.rejected_total == 0
@@ -0,0 +1,107 @@
+"""Tests for the coalescing of holding register writes."""
+import asyncio
+
+from custom_components.ingeteam_modbus.writes import WriteCoalescer, build_batches
+
+
+def test_build_batches_groups_contiguous_addresses():
+    assert build_batches({12: 1, 10: 2, 11: 3, 20: 4}) == [(10, [2, 3, 1]), (20, [4])]
+
+
+def test_build_batches_splits_at_the_batch_size():
+    registers = dict.fromkeys(range(5), 0)
+    assert build_batches(registers, max_batch=2) == [(0, [0, 0]), (2, [0, 0]), (4, [0])]
+
+
+class FakeDevice:
+    """Records the batches sent and answers with what the registers hold."""
+
+    def __init__(self, rejected=(), delay=0.0):
+        self.registers = {}
+        self.sent = []
+        self.rejected = set(rejected)
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def send(self, batches):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.sent.append(batches)
+        await asyncio.sleep(self.delay)
+        for start, values in batches:
+            for offset, value in enumerate(values):
+                if start + offset not in self.rejected:
+                    self.registers[start + offset] = value
+        self.active -= 1
+        return dict(self.registers)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_writes_within_the_delay_are_sent_as_one_batch():
+    async def scenario():
+        device = FakeDevice()
+        writes = WriteCoalescer(asyncio.get_running_loop(), device.send, delay=0.01)
+        results = await asyncio.gather(writes.write(10, [1, 2]), writes.write(12, [3]))
+        return device, results
+
+    device, results = run(scenario())
+    assert results == [True, True]
+    assert device.sent == [[(10, [1, 2, 3])]]
+
+
+def test_each_caller_is_verified_on_its_own_registers():
+    async def scenario():
+        device = FakeDevice(rejected={20})
+        writes = WriteCoalescer(asyncio.get_running_loop(), device.send, delay=0.01)
+        return await asyncio.gather(writes.write(10, [1]), writes.write(20, [5]))
+
+    assert run(scenario()) == [True, False]
+
+
+def test_overwritten_value_is_not_reported_as_written():
+    async def scenario():
+        device = FakeDevice()
+        writes = WriteCoalescer(asyncio.get_running_loop(), device.send, delay=0.01)
+        results = await asyncio.gather(writes.write(10, [1]), writes.write(10, [2]))
+        return device, results
+
+    device, results = run(scenario())
+    assert results == [False, True]
+    assert device.sent == [[(10, [2])]]
+
+
+def test_one_flush_at_a_time_and_newest_value_wins():
+    async def scenario():
+        device = FakeDevice(delay=0.05)
+        writes = WriteCoalescer(asyncio.get_running_loop(), device.send, delay=0.01)
+        first = asyncio.ensure_future(writes.write(10, [1]))
+        await asyncio.sleep(0.02)  # first flush is now on the wire
+        second = asyncio.ensure_future(writes.write(10, [2]))
+        results = await asyncio.gather(first, second)
+        return device, results
+
+    device, results = run(scenario())
+    assert results == [True, True]
+    assert device.max_active == 1
+    assert device.sent == [[(10, [1])], [(10, [2])]]
+    assert device.registers[10] == 2
+
+
+def test_cancel_releases_waiters_without_sending():
+    async def scenario():
+        device = FakeDevice()
+        writes = WriteCoalescer(asyncio.get_running_loop(), device.send, delay=0.01)
+        pending = asyncio.ensure_future(writes.write(10, [1]))
+        await asyncio.sleep(0)
+        writes.cancel()
+        result = await pending
+        await asyncio.sleep(0.02)
+        return device, result
+
+    device, result = run(scenario())
+    assert result is False
+    assert device.sent == []